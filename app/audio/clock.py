@@ -0,0 +1,85 @@
+import asyncio
+import heapq
+import logging
+from dataclasses import dataclass
+from time import time
+
+logger = logging.getLogger(__name__)
+
+TICK_INTERVAL = 0.02  # 20ms
+
+
+@dataclass
+class ClockStats:
+    frames: int = 0
+    jitter: float = 0.0  # 평균 지연 (초)
+    max_jitter: float = 0.0
+
+    def record(self, lateness: float):
+        # 일찍 깨운 경우도 지연과 같이 집계
+        lateness = abs(lateness)
+        self.frames += 1
+        self.jitter += (lateness - self.jitter) / self.frames
+        self.max_jitter = max(self.max_jitter, lateness)
+
+
+class MediaClock:
+    # 모든 송신 트랙이 공유하는 20ms 시계. 한 번의 tick 으로 대기 중인 recv() 를 모두 깨움
+    def __init__(self, interval: float = TICK_INTERVAL):
+        self.interval = interval
+        # tick 은 항상 origin + n * interval 시각 (ticker 가 다시 시작돼도 위상이 같음)
+        self.origin = time()
+        self.waiters = []
+        self.sequence = 0
+        self.task: asyncio.Task = None
+
+    def align(self, timestamp: float) -> float:
+        # 가장 가까운 tick 시각, 트랙의 시작을 tick 에 맞추면 양자화 오차가 없음
+        ticks = round((timestamp - self.origin) / self.interval)
+        return self.origin + ticks * self.interval
+
+    async def wait_until(self, deadline: float, stats: ClockStats = None):
+        # tick 간격의 절반 이내로 남았으면 기다리지 않음
+        if deadline - time() <= self.interval / 2:
+            if stats:
+                stats.record(time() - deadline)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self.waiters, (deadline, self.sequence, future, stats))
+        self.sequence += 1
+
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._run())
+
+        await future
+
+    def _next_tick(self, now: float) -> float:
+        tick = self.align(now)
+        return tick if tick > now else tick + self.interval
+
+    async def _run(self):
+        tick = self._next_tick(time())
+        while self.waiters:
+            wait = tick - time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            now = time()
+            self._release(now + self.interval / 2, now)
+
+            # drift 보정: 루프가 밀려 tick 을 놓쳤으면 origin 기준의 다음 tick 으로 건너뜀
+            tick = max(tick + self.interval, self._next_tick(now))
+
+    def _release(self, until: float, now: float):
+        waiters = self.waiters
+        while waiters and waiters[0][0] <= until:
+            deadline, _, future, stats = heapq.heappop(waiters)
+            if future.done():
+                continue
+            if stats:
+                stats.record(now - deadline)
+            future.set_result(None)
+
+
+media_clock = MediaClock()
@@ -0,0 +1,96 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from time import time
+from typing import Awaitable, Callable
+
+from app.config import DSP_MODE, DSP_QUEUE_SIZE, DSP_WORKERS
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+LAG_WARNING_THRESHOLD = 0.1  # 100ms
+
+_executor: ThreadPoolExecutor = None
+
+
+def get_executor() -> ThreadPoolExecutor | None:
+    global _executor
+    if DSP_MODE != "thread":
+        return None
+
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=DSP_WORKERS, thread_name_prefix="dsp"
+        )
+    return _executor
+
+
+@dataclass
+class DSPStats:
+    frames: int = 0
+    dropped: int = 0
+    max_lag: float = 0.0
+    behind: bool = False
+
+    def record(self, lag: float):
+        self.frames += 1
+        self.max_lag = max(self.max_lag, lag)
+
+
+class DSPPipeline:
+    def __init__(self, sid, process: Callable):
+        self.sid = sid
+        self.process = process
+        self.executor = get_executor()
+        self.queue = asyncio.Queue(maxsize=DSP_QUEUE_SIZE)
+        self.stats = DSPStats()
+
+    async def run(self, source: Callable[[], Awaitable], sink: Callable[..., Awaitable]):
+        if self.executor is None:
+            while True:
+                frame = await source()
+                self.stats.record(0)
+                await sink(*self.process(frame))
+
+        loop = asyncio.get_running_loop()
+        reader = asyncio.create_task(self._read(source))
+        try:
+            while True:
+                item = await self.queue.get()
+                if item is None:
+                    # source 에서 발생한 예외 전달
+                    await reader
+                    return
+
+                frame, received_at = item
+                self._check_lag(time() - received_at)
+                result = await loop.run_in_executor(self.executor, self.process, frame)
+                await sink(*result)
+        finally:
+            reader.cancel()
+
+    async def _read(self, source: Callable[[], Awaitable]):
+        try:
+            while True:
+                frame = await source()
+                if self.queue.full():
+                    self.queue.get_nowait()
+                    self.stats.dropped += 1
+                self.queue.put_nowait((frame, time()))
+        finally:
+            if self.queue.full():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+    def _check_lag(self, lag: float):
+        self.stats.record(lag)
+
+        behind = lag > LAG_WARNING_THRESHOLD
+        if behind and not self.stats.behind:
+            logger.warning(
+                f"🐢 DSP falls behind real time: {self.sid} "
+                f"(lag {lag * 1000:.0f}ms, dropped {self.stats.dropped})"
+            )
+        self.stats.behind = behind
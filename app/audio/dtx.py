@@ -0,0 +1,78 @@
+import logging
+from time import perf_counter
+
+from aiortc import rtcrtpsender
+from aiortc.codecs import get_encoder
+from aiortc.codecs.base import Encoder
+from aiortc.rtcrtpparameters import RTCRtpCodecParameters
+from av import AudioFrame
+
+logger = logging.getLogger(__name__)
+
+HANGOVER_FRAMES = 5  # 무음 시작 후 100ms 는 그대로 인코딩
+DTX_INTERVAL = 20  # 이후 400ms 마다 한 번만 전송 (Opus DTX 주기)
+STATS_INTERVAL = 3000  # 1분 (20ms 프레임 기준)
+
+
+def is_silent(frame: AudioFrame) -> bool:
+    # PCM 내용으로 판단 (공유 무음 프레임과 합성 결과의 무음 구간 모두 해당)
+    return not frame.to_ndarray().any()
+
+
+class DTXEncoder(Encoder):
+    # 무음 프레임을 인코딩하지 않고 건너뛰어 idle 세션의 CPU 와 대역폭을 줄임
+    def __init__(self, encoder: Encoder):
+        self.encoder = encoder
+        self.silent_count = 0
+
+        self.frames = 0
+        self.suppressed = 0
+        self.bytes = 0
+        self.encode_time = 0.0
+
+    def encode(
+        self, frame: AudioFrame, force_keyframe: bool = False
+    ) -> tuple[list[bytes], int]:
+        self.frames += 1
+        if self.frames % STATS_INTERVAL == 0:
+            self._log_stats()
+
+        if is_silent(frame):
+            self.silent_count += 1
+            silent = self.silent_count - HANGOVER_FRAMES
+            if silent > 0 and silent % DTX_INTERVAL:
+                self.suppressed += 1
+                return [], frame.pts
+        else:
+            self.silent_count = 0
+
+        start = perf_counter()
+        payloads, timestamp = self.encoder.encode(frame, force_keyframe)
+        self.encode_time += perf_counter() - start
+        self.bytes += sum(len(payload) for payload in payloads)
+        return payloads, timestamp
+
+    def pack(self, packet):
+        return self.encoder.pack(packet)
+
+    def _log_stats(self):
+        logger.debug(
+            f"🔇 DTX per minute: {self.bytes} bytes, "
+            f"encode {self.encode_time * 1000:.1f}ms, "
+            f"suppressed {self.suppressed}/{STATS_INTERVAL} frames"
+        )
+        self.suppressed = 0
+        self.bytes = 0
+        self.encode_time = 0.0
+
+
+def _get_encoder(codec: RTCRtpCodecParameters) -> Encoder:
+    encoder = get_encoder(codec)
+    if codec.mimeType.lower() == "audio/opus":
+        return DTXEncoder(encoder)
+    return encoder
+
+
+def install_dtx():
+    # aiortc 에는 encoder 를 지정하는 확장 지점이 없어 sender 모듈의 get_encoder 를 교체
+    rtcrtpsender.get_encoder = _get_encoder
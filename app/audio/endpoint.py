@@ -0,0 +1,96 @@
+from abc import ABC, abstractmethod
+from collections import deque
+
+import numpy as np
+
+FRAME_TIME = 20  # 20ms
+
+
+class Endpointer(ABC):
+    # 발화 종료 후 STT 로 보내는 마지막 chunk 길이와 뒤에 붙이는 무음
+    last_chunk_ms = 500
+    trailing_silence_ms = 2000
+    trailing_silence_chunks = 2
+
+    @abstractmethod
+    def update(self, is_speech: bool) -> bool:
+        # 발화가 끝났다고 판단되면 True
+        pass
+
+    @abstractmethod
+    def reset(self):
+        pass
+
+
+class FixedEndpointer(Endpointer):
+    def __init__(self, hangover_ms: int = 500):
+        self.hangover = hangover_ms // FRAME_TIME
+        self.silence_count = 0
+
+    def update(self, is_speech: bool) -> bool:
+        if is_speech:
+            self.silence_count = 0
+            return False
+
+        self.silence_count += 1
+        return self.silence_count > self.hangover
+
+    def reset(self):
+        self.silence_count = 0
+
+
+class AdaptiveEndpointer(Endpointer):
+    last_chunk_ms = 200
+    trailing_silence_ms = 0
+    trailing_silence_chunks = 0
+
+    DEFAULT_HANGOVER = 500 // FRAME_TIME
+    MIN_HANGOVER = 200 // FRAME_TIME
+    MAX_HANGOVER = 800 // FRAME_TIME
+    MARGIN = 60 // FRAME_TIME
+    MIN_PAUSES = 5
+
+    def __init__(self):
+        # 화자의 발화 중 쉼 길이 통계 (세션 동안 유지)
+        self.pauses = deque(maxlen=50)
+        self.recent = deque(maxlen=10)
+        self.silence_count = 0
+        self.confidence = 1.0
+
+    def hangover(self) -> int:
+        if len(self.pauses) < self.MIN_PAUSES:
+            hangover = self.DEFAULT_HANGOVER
+        else:
+            hangover = np.percentile(self.pauses, 90) + self.MARGIN
+
+        # 직전 음성 구간의 VAD 판정이 불안정하면 더 오래 기다림
+        if self.confidence < 0.6:
+            hangover *= 1.5
+
+        return int(min(max(hangover, self.MIN_HANGOVER), self.MAX_HANGOVER))
+
+    def update(self, is_speech: bool) -> bool:
+        if is_speech:
+            if self.silence_count >= 2:
+                self.pauses.append(self.silence_count)
+            self.silence_count = 0
+            self.recent.append(1)
+            return False
+
+        if self.silence_count == 0 and self.recent:
+            self.confidence = sum(self.recent) / len(self.recent)
+
+        self.silence_count += 1
+        self.recent.append(0)
+        return self.silence_count > self.hangover()
+
+    def reset(self):
+        self.silence_count = 0
+        self.recent.clear()
+        self.confidence = 1.0
+
+
+def create_endpointer(mode: str) -> Endpointer:
+    if mode == "adaptive":
+        return AdaptiveEndpointer()
+    return FixedEndpointer()
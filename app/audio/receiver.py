@@ -2,12 +2,14 @@ import asyncio
 import logging
 from time import time
 
-import numpy as np
 import webrtcvad
 from aiortc.mediastreams import MediaStreamError
 from aiortc.rtcrtpreceiver import RemoteStreamTrack
 
-from app.audio.resample import resample_to_16k, resample_to_mono
+from app.audio.dsp import DSPPipeline
+from app.audio.endpoint import create_endpointer
+from app.audio.resample import MonoDownmixer, StreamingResampler
+from app.config import ENDPOINT_MODE, STT_START_MODE
 from app.rnnoise import RNNoise
 from app.service.stt import STTService
 from app.util.time import log_time
@@ -17,14 +19,12 @@ logger.setLevel(logging.DEBUG)
 
 # 1ms 당 PCM 데이터: 16kHz => 16 samples/ms, each sample 2 bytes -> 16*2 = 32 bytes/ms.
 BYTES_PER_MS = 16 * 2
-BYTES_PER_SECOND = BYTES_PER_MS * 1000
 MAX_BUFFER_SIZE = BYTES_PER_MS * 200  # 200ms
-LAST_CHUNK_SIZE = BYTES_PER_MS * 500
 
 UNIT_PCM_CHUNK_TIME = 20  # 20ms
 VAD_SIZE = BYTES_PER_MS * UNIT_PCM_CHUNK_TIME
 TASK_RUN_THRESHOLD = 300 // UNIT_PCM_CHUNK_TIME
-SPEECH_END_THRESHOLD = 500 // UNIT_PCM_CHUNK_TIME
+BLIP_THRESHOLD = 200 // UNIT_PCM_CHUNK_TIME
 
 
 class AudioReceiver:
@@ -33,67 +33,92 @@ class AudioReceiver:
         track: RemoteStreamTrack,
         sid,
         on_stt_finished,
+        on_stt_segment=None,
+        on_stt_cancelled=None,
     ):
         super().__init__()
         self.track = track
         self.sid = sid
 
         self.rnnoise = RNNoise()
+        self.downmixer = MonoDownmixer()
+        self.resampler = StreamingResampler(down=3)
         self.vad = webrtcvad.Vad(3)
+        self.dsp = DSPPipeline(sid, self.process_frame)
+        self.endpointer = create_endpointer(ENDPOINT_MODE)
         self.in_speech = False
-        self.speech_count = 0
+        self.voiced_count = 0
         self.queue = asyncio.Queue()
+        self.speculative = STT_START_MODE == "speculative"
 
         self.response_task = None
         self.stt_service = STTService()
         self.stt_finished_callback = on_stt_finished
+        self.stt_segment_callback = on_stt_segment
+        self.stt_cancelled_callback = on_stt_cancelled
 
         self.speech_end_time = None
 
     async def recv(self):
         try:
-            while True:
-                frame = await self.track.recv()
-                pcm_48k = memoryview(frame.planes[0])
-                mono = resample_to_mono(pcm_48k, np.float32)
-                denoised = self.rnnoise.process(mono)
-                pcm_16k = resample_to_16k(denoised)
-                await self.detect_speech(pcm_16k)
+            await self.dsp.run(self.track.recv, self.detect_speech)
 
         except MediaStreamError:
-            logger.info(f"❌ MediaStream 종료: {self.sid}")
+            logger.info(f"❌ MediaStream 종료: {self.sid} ({self.dsp.stats})")
 
-    async def detect_speech(self, pcm: bytes):
-        if self.response_task and not self.in_speech:
-            return
+    def process_frame(self, frame) -> tuple[bytes, bool]:
+        pcm_48k = memoryview(frame.planes[0])
+        mono = self.downmixer.process(pcm_48k)
+        denoised = self.rnnoise.process(mono)
+        pcm_16k = self.resampler.process(denoised)
 
-        chunk = self.get_vad_chunk(pcm)
+        chunk = self.get_vad_chunk(pcm_16k)
         is_speech = self.vad.is_speech(chunk, 16000)
+        return pcm_16k, is_speech
+
+    async def detect_speech(self, pcm: bytes, is_speech: bool):
+        if self.response_task and not self.in_speech:
+            return
 
         await self.queue.put(pcm)
 
         if is_speech:
-            self.speech_count = 0
+            self.endpointer.update(True)
+            self.voiced_count += 1
             if not self.in_speech:
                 self.in_speech = True
 
-            if (
-                self.response_task is None
-                and self.queue.qsize() > TASK_RUN_THRESHOLD + 5
-            ):
+            if self.response_task is None and self.should_start_stt():
                 self.response_task = asyncio.create_task(self.create_response())
 
             return
 
         if self.in_speech:
-            self.speech_count += 1
-            if self.speech_count > SPEECH_END_THRESHOLD:
-                await self.on_sppeech_end()
+            if self.endpointer.update(False):
+                if self.speculative and self.voiced_count < BLIP_THRESHOLD:
+                    await self.cancel_speculation()
+                else:
+                    await self.on_sppeech_end()
             return
 
         if self.queue.qsize() > 5:
             await self.queue.get()
 
+    def should_start_stt(self) -> bool:
+        if self.speculative:
+            # 첫 음성 프레임에서 pre-roll 과 함께 바로 스트림 시작
+            return True
+        return self.queue.qsize() > TASK_RUN_THRESHOLD + 5
+
+    async def cancel_speculation(self):
+        self.in_speech = False
+        self.voiced_count = 0
+        self.endpointer.reset()
+
+        await self._cancel_response()
+        self.queue = asyncio.Queue()
+        logger.debug(f"🫧 짧은 소리 무시, STT 취소: {self.sid}")
+
     def get_vad_chunk(self, pcm: bytes):
         pcm_size = len(pcm)
         if pcm_size == VAD_SIZE:
@@ -111,36 +136,43 @@ class AudioReceiver:
 
         def flush_buffer(buffer, seq_id, final=False):
             if final:
-                padding = max(0, LAST_CHUNK_SIZE - len(buffer))
+                last_chunk_size = BYTES_PER_MS * self.endpointer.last_chunk_ms
+                padding = max(0, last_chunk_size - len(buffer))
                 buffer.extend(bytes(padding))
 
             joined_pcm = bytes(buffer)
             buffer.clear()
 
-            chunk = (joined_pcm, seq_id, False)
+            # 뒤에 무음을 보내지 않으면 마지막 chunk 에 바로 epFlag 설정
+            ep_flag = final and not self.endpointer.trailing_silence_chunks
+            chunk = (joined_pcm, seq_id, ep_flag)
             return chunk
 
         while True:
             pcm = await self.queue.get()
             if pcm is None:
                 yield flush_buffer(buffer, seq_id, final=True)
-                silence = bytes(BYTES_PER_SECOND * 2)
-                for i in range(1, 3):
+                silence = bytes(BYTES_PER_MS * self.endpointer.trailing_silence_ms)
+                for i in range(1, self.endpointer.trailing_silence_chunks + 1):
                     yield (silence, seq_id + i, True)
                 self.queue = asyncio.Queue()
                 return
 
             buffer.extend(pcm)
 
-            if len(buffer) >= MAX_BUFFER_SIZE:
+            # speculative 모드에서는 쌓여 있던 pre-roll 을 바로 전송
+            preroll = self.speculative and seq_id == 0 and self.queue.empty()
+            if len(buffer) >= MAX_BUFFER_SIZE or preroll:
                 yield flush_buffer(buffer, seq_id)
                 seq_id += 1
 
     async def create_response(self):
         try:
-            result = await self.stt_service.run(self.generate_pcm_iter())
+            result = await self.stt_service.run(
+                self.generate_pcm_iter(), self.stt_segment_callback
+            )
 
-            log_time(self.speech_end_time, "STT")
+            log_time(self.speech_end_time, f"STT ({STT_START_MODE})")
             self.speech_end_time = None
 
             if result.success and not result.text:
@@ -153,16 +185,29 @@ class AudioReceiver:
     async def cancel(self):
         self.track.stop()
 
-        if self.response_task:
-            self.response_task.cancel()
-            try:
-                await self.response_task
-            except asyncio.CancelledError:
-                logger.info(f"❌ 응답 생성 취소: {self.sid}")
+        if await self._cancel_response():
+            logger.info(f"❌ 응답 생성 취소: {self.sid}")
 
         await self.stt_service.close()
 
+    async def _cancel_response(self) -> bool:
+        if not self.response_task:
+            return False
+
+        self.response_task.cancel()
+        try:
+            await self.response_task
+        except asyncio.CancelledError:
+            pass
+
+        # STT 세그먼트로 미리 시작한 LLM 응답도 함께 폐기
+        if self.stt_cancelled_callback:
+            await self.stt_cancelled_callback()
+        return True
+
     async def on_sppeech_end(self):
         await self.queue.put(None)
         self.speech_end_time = time()
         self.in_speech = False
+        self.voiced_count = 0
+        self.endpointer.reset()
@@ -1,5 +1,6 @@
 import numpy as np
-from scipy.signal import resample_poly
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import firwin, resample_poly
 
 
 def resample_to_mono(pcm_48k: memoryview, type: np.int16 | np.float32) -> np.ndarray:
@@ -18,3 +19,72 @@ def resample_to_16k(pcm_48k_mono: np.ndarray) -> bytes:
 
     # 다시 bytes로 변환
     return resampled.astype(np.int16).tobytes()
+
+
+class MonoDownmixer:
+    def __init__(self, frame_size: int = 960):
+        self._allocate(frame_size)
+
+    def _allocate(self, frame_size: int):
+        self._mono = np.empty(frame_size, dtype=np.float32)
+        self._right = np.empty(frame_size, dtype=np.float32)
+
+    def process(self, pcm_48k: memoryview) -> np.ndarray:
+        # stereo int16 → mono float32 (float64 중간 단계 없이 재사용 버퍼에 바로 기록)
+        stereo = np.frombuffer(pcm_48k, dtype=np.int16).reshape(-1, 2)
+        if len(stereo) != len(self._mono):
+            self._allocate(len(stereo))
+
+        mono, right = self._mono, self._right
+        np.copyto(mono, stereo[:, 0])
+        np.copyto(right, stereo[:, 1])
+        mono += right
+        mono *= 0.5
+        return mono
+
+
+class StreamingResampler:
+    # resample_poly 와 동일한 anti-alias 필터 (kaiser, beta=5.0)
+    HALF_LEN_PER_RATE = 10
+
+    def __init__(self, down: int = 3, frame_size: int = 960):
+        self.down = down
+
+        half_len = self.HALF_LEN_PER_RATE * down
+        taps = firwin(2 * half_len + 1, 1 / down, window=("kaiser", 5.0))
+        self._taps = taps[::-1].astype(np.float32)
+        self._history = len(taps) - 1
+        self._phase = 0
+
+        self._allocate(frame_size)
+
+    def _allocate(self, frame_size: int):
+        self._frame_size = frame_size
+        self._buffer = np.zeros(self._history + frame_size, dtype=np.float32)
+        max_out = len(self._buffer) // self.down + 1
+        self._out = np.empty(max_out, dtype=np.float32)
+        self._pcm = np.empty(max_out, dtype=np.int16)
+
+    def process(self, pcm: np.ndarray) -> bytes:
+        size = len(pcm)
+        if size != self._frame_size:
+            history = self._buffer[-self._history :].copy()
+            self._allocate(size)
+            self._buffer[: self._history] = history
+
+        buffer = self._buffer
+        buffer[self._history :] = pcm
+
+        windows = sliding_window_view(buffer, len(self._taps))[self._phase :: self.down]
+        count = len(windows)
+        out = self._out[:count]
+        np.matmul(windows, self._taps, out=out)
+
+        # 다음 호출을 위해 필터 history 와 위상 유지
+        self._phase += count * self.down - size
+        buffer[: self._history] = buffer[size:]
+
+        np.clip(out, -32768, 32767, out=out)
+        pcm_16k = self._pcm[:count]
+        np.copyto(pcm_16k, out, casting="unsafe")
+        return pcm_16k.tobytes()
@@ -0,0 +1,59 @@
+import numpy as np
+
+
+class PCMRingBuffer:
+    # 이벤트 루프 안에서 단일 생산자/단일 소비자로 사용 (lock 불필요)
+    def __init__(self, capacity: int = 48000 * 2):
+        self._data = np.zeros(capacity, dtype=np.int16)
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    def _grow(self, required: int):
+        capacity = self.capacity
+        while capacity < required:
+            capacity *= 2
+
+        data = np.zeros(capacity, dtype=np.int16)
+        self._copy_out(data, self._size)
+        self._data = data
+        self._start = 0
+
+    def write(self, chunk: bytes):
+        pcm = np.frombuffer(chunk, dtype=np.int16)
+        size = len(pcm)
+        if self._size + size > self.capacity:
+            self._grow(self._size + size)
+
+        capacity = self.capacity
+        end = (self._start + self._size) % capacity
+        first = min(size, capacity - end)
+        self._data[end : end + first] = pcm[:first]
+        self._data[: size - first] = pcm[first:]
+        self._size += size
+
+    def _copy_out(self, out: np.ndarray, size: int):
+        capacity = self.capacity
+        first = min(size, capacity - self._start)
+        out[:first] = self._data[self._start : self._start + first]
+        out[first:size] = self._data[: size - first]
+
+    def read_into(self, out: np.ndarray) -> int:
+        # out 을 채우고 부족한 부분은 0 으로 채움. 실제로 읽은 샘플 수 반환
+        size = min(len(out), self._size)
+        self._copy_out(out, size)
+        out[size:] = 0
+
+        self._start = (self._start + size) % self.capacity
+        self._size -= size
+        return size
+
+    def clear(self):
+        self._start = 0
+        self._size = 0
@@ -8,6 +8,8 @@ from aiortc import MediaStreamTrack
 from av import AudioFrame
 from numpy import ndarray
 
+from app.audio.clock import ClockStats, media_clock
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,15 +27,16 @@ class AudioTrack(MediaStreamTrack):
         self._stream_start = None
         self._audio_start = None
         self._timestamp = 0
+        self.clock_stats = ClockStats()
+        self._silent_frame: AudioFrame = None
 
     async def sleep(self):
         if self._audio_start:
             self._timestamp += self.samples_per_frame
-            wait = self._audio_start + (self._timestamp / self.sample_rate) - time()
-            if wait > 0:
-                await asyncio.sleep(wait)
+            deadline = self._audio_start + (self._timestamp / self.sample_rate)
+            await media_clock.wait_until(deadline, self.clock_stats)
         else:
-            self.audio_start = time()
+            self.audio_start = media_clock.align(time())
 
     def create_frame(self, pcm: ndarray) -> AudioFrame:
         frame = AudioFrame.from_ndarray(pcm.reshape(1, -1), format="s16", layout="mono")
@@ -42,17 +45,28 @@ class AudioTrack(MediaStreamTrack):
         frame.time_base = self.time_base
         return frame
 
+    def create_silent_frame(self) -> AudioFrame:
+        # 무음 프레임은 한 번만 만들어 두고 pts 만 바꿔서 재사용
+        frame = self._silent_frame
+        if frame is None or frame.sample_rate != self.sample_rate:
+            data = np.zeros(self.samples_per_frame, dtype=np.int16)
+            frame = self.create_frame(data)
+            self._silent_frame = frame
+
+        frame.pts = self._timestamp + self.offset
+        frame.time_base = self.time_base
+        return frame
+
     async def recv(self) -> AudioFrame:
         await self.event.wait()
 
-        data = np.zeros(self.samples_per_frame, dtype=np.int16)
         await self.sleep()
-        return self.create_frame(data)
+        return self.create_silent_frame()
 
     def stop(self):
         self.event.set()
         super().stop()
-        logger.info(f"🛑 Track stopped: {self.id}")
+        logger.info(f"🛑 Track stopped: {self.id} ({self.clock_stats})")
 
     @property
     def sample_rate(self) -> int:
@@ -7,7 +7,79 @@ load_dotenv()
 allowed_origins = getenv("ALLOWED_ORIGINS", "*").split(",")
 
 RNNOISE_PATH = getenv("RNNOISE_PATH")
+RNNOISE_BATCH_PATH = getenv("RNNOISE_BATCH_PATH")
+
+# "inline": 이벤트 루프에서 처리, "thread": DSP 전용 스레드 풀에서 처리
+DSP_MODE = getenv("DSP_MODE", "inline")
+DSP_WORKERS = int(getenv("DSP_WORKERS", "4"))
+DSP_QUEUE_SIZE = int(getenv("DSP_QUEUE_SIZE", "10"))
 
 GROQ_API_KEY = getenv("GROQ_API_KEY")
 
 GEMINI_API_KEY = getenv("GEMINI_API_KEY")
+
+# "threshold": 약 400ms 발화 후 STT 시작, "speculative": 첫 음성 프레임에서 STT 시작
+STT_START_MODE = getenv("STT_START_MODE", "threshold")
+# "fixed": 500ms 무음 후 종료, "adaptive": 화자의 쉼 길이에 맞춰 종료
+ENDPOINT_MODE = getenv("ENDPOINT_MODE", "fixed")
+# STT 세그먼트가 나오는 즉시 LLM 요청을 미리 시작
+STT_PIPELINING = getenv("STT_PIPELINING", "false").lower() == "true"
+STT_TARGET = getenv("STT_TARGET", "clovaspeech-gw.ncloud.com:50051")
+STT_INSECURE = getenv("STT_INSECURE", "false").lower() == "true"  # 로컬 fake 서버용
+STT_CHANNEL_POOL_SIZE = int(getenv("STT_CHANNEL_POOL_SIZE", "2"))
+STT_MAX_STREAMS_PER_CHANNEL = int(getenv("STT_MAX_STREAMS_PER_CHANNEL", "100"))
+
+# 목소리별로 미리 연결해 두는 SpeechSynthesizer 수
+TTS_POOL_SIZE = int(getenv("TTS_POOL_SIZE", "2"))
+# 문장을 동시에 미리 합성하는 최대 개수
+TTS_MAX_AHEAD = int(getenv("TTS_MAX_AHEAD", "3"))
+
+# 짧은 문장의 TTS 결과(PCM, viseme) 캐시
+TTS_CACHE_MAX_BYTES = int(getenv("TTS_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+TTS_CACHE_MAX_TEXT = int(getenv("TTS_CACHE_MAX_TEXT", "50"))
+# 같은 문장이 이 횟수만큼 합성되면 캐시에 저장 (고정 문구는 바로 저장)
+TTS_CACHE_ADMIT_REPEATS = int(getenv("TTS_CACHE_ADMIT_REPEATS", "2"))
+TTS_CACHE_DIR = getenv("TTS_CACHE_DIR")  # 설정하면 디스크에 저장하고 mmap 으로 읽음
+TTS_CACHE_DISK_MAX_BYTES = int(
+    getenv("TTS_CACHE_DISK_MAX_BYTES", str(256 * 1024 * 1024))
+)
+
+# 무음 구간의 Opus 인코딩/전송 생략 (aiortc 의 encoder 를 교체하므로 기본값은 off)
+OPUS_DTX = getenv("OPUS_DTX", "false").lower() == "true"
+
+# LLM 스트림을 TTS 로 보낼 문장 길이 (min 보다 짧으면 다음 문장과 합치고, max 를 넘으면 절 단위로 자름)
+SENTENCE_MIN_LENGTH = int(getenv("SENTENCE_MIN_LENGTH", "1"))
+SENTENCE_MAX_LENGTH = int(getenv("SENTENCE_MAX_LENGTH", "150"))
+
+# LLM 에 보내는 대화 기록의 최대 토큰 수 (system prompt 제외)
+CHAT_HISTORY_TOKENS = int(getenv("CHAT_HISTORY_TOKENS", "2000"))
+# 창 밖으로 밀려난 대화를 백그라운드에서 요약해 함께 전송
+CHAT_HISTORY_SUMMARY = getenv("CHAT_HISTORY_SUMMARY", "false").lower() == "true"
+
+# Groq 대신 OpenAI 호환 endpoint 로 연결 (로컬 fake 서버용)
+GROQ_BASE_URL = getenv("GROQ_BASE_URL", "https://api.groq.com/openai/v1")
+# Gemini 에서 system prompt + 대화 기록 앞부분을 context cache 로 재사용
+# 캐시는 prompt 가 GEMINI_CACHE_MIN_TOKENS (API 최소 크기) 이상일 때만 만들어지므로
+# CHAT_HISTORY_TOKENS + system prompt 가 그보다 커야 함 (작으면 시작 시 경고)
+GEMINI_PREFIX_CACHE = getenv("GEMINI_PREFIX_CACHE", "false").lower() == "true"
+GEMINI_CACHE_MIN_TOKENS = int(getenv("GEMINI_CACHE_MIN_TOKENS", "4096"))
+GEMINI_CACHE_TTL = int(getenv("GEMINI_CACHE_TTL", "600"))  # seconds
+
+# 세션 간에 공유하는 LLM HTTP client 의 연결 풀
+LLM_HTTP2 = getenv("LLM_HTTP2", "true").lower() == "true"
+LLM_MAX_CONNECTIONS = int(getenv("LLM_MAX_CONNECTIONS", "100"))
+LLM_KEEPALIVE_EXPIRY = float(getenv("LLM_KEEPALIVE_EXPIRY", "60"))  # seconds
+
+# primary LLM 의 첫 토큰이 늦으면 다른 모델로 동시에 요청 (hedged request)
+LLM_HEDGE = getenv("LLM_HEDGE", "false").lower() == "true"
+LLM_HEDGE_MODEL = getenv("LLM_HEDGE_MODEL", "gemini-2.0-flash-lite")
+LLM_HEDGE_PERCENTILE = float(getenv("LLM_HEDGE_PERCENTILE", "90"))
+LLM_HEDGE_DEADLINE = float(getenv("LLM_HEDGE_DEADLINE", "1.0"))  # 기록이 적을 때
+LLM_HEDGE_MIN_SAMPLES = int(getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+
+# 짧은 발화에 대한 LLM 응답 캐시 (응답 문장의 TTS 결과도 함께 캐시)
+RESPONSE_CACHE = getenv("RESPONSE_CACHE", "false").lower() == "true"
+RESPONSE_CACHE_MAX_ENTRIES = int(getenv("RESPONSE_CACHE_MAX_ENTRIES", "1000"))
+RESPONSE_CACHE_MAX_TEXT = int(getenv("RESPONSE_CACHE_MAX_TEXT", "20"))
+RESPONSE_CACHE_TTL = float(getenv("RESPONSE_CACHE_TTL", "3600"))  # seconds
+RESPONSE_CACHE_CONTEXT = int(getenv("RESPONSE_CACHE_CONTEXT", "2"))  # 직전 메시지 수
@@ -18,6 +18,7 @@ class Session:
         self.sio = sio
         self.chat = ChatService(sid)
         self.voice = SynthesisVoiceKorean.InJoon
+        self.viseme_version = 1
         self.peer_connection: PeerConnection = None
 
     async def remove_peer_connection(self):
@@ -40,6 +41,7 @@ class Session:
 
     def create_peer_connection(self):
         pc = PeerConnection(self.sid, self.chat, self.voice)
+        pc.tts_track.viseme_version = self.viseme_version
         self.peer_connection = pc
 
         @pc.on("track")
@@ -88,3 +90,4 @@ class SessionManager:
             session = self.sessions.pop(sid, None)
         if session:
             await session.remove_peer_connection()
+            await session.chat.close()
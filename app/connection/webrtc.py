@@ -2,12 +2,21 @@ import asyncio
 
 from aiortc import RTCPeerConnection
 
+from app.audio.dtx import install_dtx
 from app.audio.receiver import AudioReceiver
+from app.config import OPUS_DTX, STT_PIPELINING
 from app.service.chat import ChatService
-from app.service.stt import STTResult
+from app.service.stt import STTResult, STTSegment
 from app.service.tts import TTSAudioTrack
 from app.websocket.emit import emit_speech_message
 
+NO_SLOT_MESSAGE = "서버 연결이 원활하지 않습니다.다시 말씀해 주세요."
+UNAVAILABLE_MESSAGE = "음성 인식 서버에 문제가 발생했습니다.나중에 다시 시도해 주세요."
+STT_FAILED_MESSAGE = "음성 인식에 실패했습니다.잠시 후 다시 시도해 주세요."
+
+if OPUS_DTX:
+    install_dtx()
+
 
 class PeerConnection(RTCPeerConnection):
     def __init__(self, sid, chat_service: ChatService, voice):
@@ -23,26 +32,44 @@ class PeerConnection(RTCPeerConnection):
         if self.audio_receiver:
             return
 
-        self.audio_receiver = AudioReceiver(track, self.sid, self.create_tts_response)
+        self.audio_receiver = AudioReceiver(
+            track,
+            self.sid,
+            self.create_tts_response,
+            self.prefetch_response if STT_PIPELINING else None,
+            self.discard_prefetch if STT_PIPELINING else None,
+        )
         self.recv_task = asyncio.create_task(self.audio_receiver.recv())
 
+    async def prefetch_response(self, segment: STTSegment):
+        # 최종 인식 결과가 같으면 미리 시작한 LLM 응답을 그대로 사용
+        self.chat_service.prefetch_utterance(segment.transcript)
+
+    async def discard_prefetch(self):
+        self.chat_service.discard_prefetch()
+
     async def create_tts_response(self, stt: STTResult):
         if not stt.success:
+            self.chat_service.discard_prefetch()
             await self.tts_track.run_synthesis(self.generate_error_response(stt.reason))
             return
 
         text = stt.text
         emit_task = asyncio.create_task(emit_speech_message(self.sid, "user", text))
 
-        await self.tts_track.run_synthesis(self.chat_service.send_utterance_stream(text))
+        # 응답 캐시에서 재생하는 응답은 문장 길이와 상관없이 TTS 결과도 캐시
+        await self.tts_track.run_synthesis(
+            self.chat_service.send_utterance_stream(text),
+            cache_audio=self.chat_service.has_cached_response(text),
+        )
 
         await emit_task
         await self.chat_service.wait_emit_message()
 
     async def generate_error_response(self, reason: str | None):
         if reason == "No more slot":
-            yield "서버 연결이 원활하지 않습니다.다시 말씀해 주세요."
+            yield NO_SLOT_MESSAGE
         if reason == "Unavilable":
-            yield "음성 인식 서버에 문제가 발생했습니다.나중에 다시 시도해 주세요."
+            yield UNAVAILABLE_MESSAGE
         else:
-            yield "음성 인식에 실패했습니다.잠시 후 다시 시도해 주세요."
+            yield STT_FAILED_MESSAGE
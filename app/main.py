@@ -1,17 +1,55 @@
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 
 import socketio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import allowed_origins
+from app.connection.webrtc import (
+    NO_SLOT_MESSAGE,
+    STT_FAILED_MESSAGE,
+    UNAVAILABLE_MESSAGE,
+)
 from app.routers import health
+from app.service.chat import ChatService, check_prefix_cache, llm_clients
+from app.service.stt import stt_channel_pool
+from app.service.tts import SynthesisVoiceKorean, synthesizer_pool, tts_cache
 from app.websocket import SocketEventHandler, sio
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+voices = [
+    SynthesisVoiceKorean.InJoon,
+    SynthesisVoiceKorean.SunHi,
+    SynthesisVoiceKorean.HyunsuMultilingual,
+]
+
+canned_phrases = [
+    NO_SLOT_MESSAGE,
+    UNAVAILABLE_MESSAGE,
+    STT_FAILED_MESSAGE,
+    ChatService.ERROR_MESSAGE,
+]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    check_prefix_cache()
+    await stt_channel_pool.warm_up()
+    await synthesizer_pool.warm_up(voices)
+    # 고정 문구 합성은 시작을 막지 않도록 백그라운드에서 처리
+    warm_up_task = asyncio.create_task(tts_cache.warm_up(voices, canned_phrases))
+    yield
+    warm_up_task.cancel()
+    synthesizer_pool.close()
+    await stt_channel_pool.close()
+    await llm_clients.close()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -30,6 +68,7 @@ sio.event(handler.disconnect)
 sio.event(handler.offer)
 sio.event(handler.ice_candidate)
 sio.event(handler.voice)
+sio.event(handler.viseme_protocol)
 sio.event(handler.message)
 sio.event(handler.model)
 
@@ -0,0 +1,14 @@
+#include <rnnoise.h>
+
+// 여러 프레임을 한 번의 native 호출로 처리 (frame_size = rnnoise_get_frame_size())
+float rnnoise_process_frames(DenoiseState *st, float *out, const float *in, int n)
+{
+    int frame_size = rnnoise_get_frame_size();
+    float vad = 0.0f;
+
+    for (int i = 0; i < n; i++) {
+        vad = rnnoise_process_frame(st, out + i * frame_size, in + i * frame_size);
+    }
+
+    return vad;
+}
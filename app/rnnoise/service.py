@@ -2,9 +2,10 @@ import ctypes
 
 import numpy as np
 
-from app.config import RNNOISE_PATH
+from app.config import RNNOISE_BATCH_PATH, RNNOISE_PATH
 
 FRAME_SIZE = 480
+FRAME_BYTES = FRAME_SIZE * np.dtype(np.float32).itemsize
 
 
 # RNNoise 객체 생성
@@ -12,6 +13,25 @@ class DenoiseState(ctypes.Structure):
     pass
 
 
+def _load_batch_lib(path: str | None):
+    if not path:
+        return None
+
+    try:
+        lib = ctypes.cdll.LoadLibrary(path)
+    except OSError:
+        return None
+
+    lib.rnnoise_process_frames.argtypes = [
+        ctypes.POINTER(DenoiseState),
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+        ctypes.c_int,
+    ]
+    lib.rnnoise_process_frames.restype = ctypes.c_float
+    return lib
+
+
 class RNNoise:
     _frame_size = FRAME_SIZE
 
@@ -21,21 +41,40 @@ class RNNoise:
     _lib.rnnoise_destroy.argtypes = [ctypes.POINTER(DenoiseState)]
     _lib.rnnoise_process_frame.argtypes = [
         ctypes.POINTER(DenoiseState),
-        ctypes.POINTER(ctypes.c_float),
-        ctypes.POINTER(ctypes.c_float),
+        ctypes.c_void_p,
+        ctypes.c_void_p,
     ]
+    _lib.rnnoise_process_frame.restype = ctypes.c_float
+
+    # rnnoise_process_frames 를 제공하는 shim (app/rnnoise/batch.c)
+    _batch_lib = _load_batch_lib(RNNOISE_BATCH_PATH)
 
-    def __init__(self):
+    def __init__(self, time=2):
         self._state = self._lib.rnnoise_create(None)
         if not self._state:
             raise RuntimeError("❌ rnnoise_create returned NULL pointer")
 
+        # 세션마다 재사용하는 출력 버퍼
+        self._output = np.empty(self._frame_size * time, dtype=np.float32)
+
     def __del__(self):
         if self._state:
             self._lib.rnnoise_destroy(self._state)
             self._state = None
 
-    def process(self, input: np.ndarray, time=2):
+    def _get_output(self, size: int, out: np.ndarray | None) -> np.ndarray:
+        if out is not None:
+            assert (
+                out.dtype == np.float32 and out.shape == (size,)
+            ), f"RNNoise output must be float32 of shape ({size},)"
+            assert out.flags.c_contiguous, "Output must be C-contiguous"
+            return out
+
+        if self._output.shape != (size,):
+            self._output = np.empty(size, dtype=np.float32)
+        return self._output
+
+    def process(self, input: np.ndarray, time=2, out: np.ndarray = None):
         assert (
             input.dtype == np.float32
         ), f"RNNoise only supports float32, but got {input.dtype}"
@@ -46,19 +85,19 @@ class RNNoise:
         ), f"RNNoise expects input shape of ({size},), but got {input.shape}"
 
         input = np.ascontiguousarray(input)
-        output = np.empty(size, dtype=np.float32)
+        output = self._get_output(size, out)
 
-        for i in range(time):
-            offset = i * self._frame_size
-            frame_in = input[offset : offset + self._frame_size]
-            frame_out = output[offset : offset + self._frame_size]
-
-            assert frame_in.flags.c_contiguous, "Input frame must be C-contiguous"
-            assert frame_out.flags.c_contiguous, "Output frame must be C-contiguous"
+        ptr_in = input.ctypes.data
+        ptr_out = output.ctypes.data
 
-            ptr_in = frame_in.ctypes.data_as(ctypes.POINTER(ctypes.c_float))
-            ptr_out = frame_out.ctypes.data_as(ctypes.POINTER(ctypes.c_float))
+        if self._batch_lib:
+            self._batch_lib.rnnoise_process_frames(self._state, ptr_out, ptr_in, time)
+            return output
 
-            self._lib.rnnoise_process_frame(self._state, ptr_out, ptr_in)
+        for i in range(time):
+            offset = i * FRAME_BYTES
+            self._lib.rnnoise_process_frame(
+                self._state, ptr_out + offset, ptr_in + offset
+            )
 
         return output
@@ -1,4 +1,5 @@
-from .google_v2 import Google
+from .client import llm_clients
+from .google_v2 import Google, check_prefix_cache
 from .groq import Groq
 from .message import Messages
 from .service import ChatService
@@ -12,4 +13,6 @@ __all__ = [
     "Provider",
     "ModelList",
     "Model",
+    "llm_clients",
+    "check_prefix_cache",
 ]
@@ -0,0 +1,111 @@
+import logging
+
+import httpx
+import openai
+from google import genai
+from google.genai import types
+
+from app.config import (
+    GEMINI_API_KEY,
+    GROQ_API_KEY,
+    GROQ_BASE_URL,
+    LLM_HTTP2,
+    LLM_KEEPALIVE_EXPIRY,
+    LLM_MAX_CONNECTIONS,
+)
+
+logger = logging.getLogger(__name__)
+
+STATS_INTERVAL = 50  # 요청 수
+
+
+class ConnectionStats:
+    # httpcore trace 로 새 TCP 연결과 TLS handshake 수를 셈
+    def __init__(self, name: str):
+        self.name = name
+        self.requests = 0
+        self.connections = 0
+        self.handshakes = 0
+
+    async def on_request(self, request: httpx.Request):
+        self.requests += 1
+        request.extensions["trace"] = self.trace
+        if self.requests % STATS_INTERVAL == 0:
+            logger.debug(f"🔌 {self.name} HTTP: {self}")
+
+    async def trace(self, event_name: str, info: dict):
+        if event_name == "connection.connect_tcp.complete":
+            self.connections += 1
+        elif event_name == "connection.start_tls.complete":
+            self.handshakes += 1
+
+    @property
+    def reuse_ratio(self) -> float:
+        if not self.requests:
+            return 0.0
+        return 1 - self.connections / self.requests
+
+    def __str__(self):
+        return (
+            f"{self.requests} requests, {self.connections} connections, "
+            f"{self.handshakes} TLS handshakes, reuse {self.reuse_ratio:.0%}"
+        )
+
+
+class LLMClients:
+    # 모든 세션이 공유하는 provider client (세션별 상태는 Messages 에만 둠)
+    def __init__(self):
+        self.openai_stats = ConnectionStats("Groq")
+        self.genai_stats = ConnectionStats("Gemini")
+        self._openai: openai.AsyncOpenAI = None
+        self._genai: genai.Client = None
+
+    def _client_args(self, stats: ConnectionStats) -> dict:
+        return {
+            "http2": LLM_HTTP2,
+            "limits": httpx.Limits(
+                max_connections=LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=LLM_MAX_CONNECTIONS,
+                keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+            ),
+            "event_hooks": {"request": [stats.on_request]},
+        }
+
+    @property
+    def openai(self) -> openai.AsyncOpenAI:
+        if self._openai is None:
+            self._openai = openai.AsyncOpenAI(
+                base_url=GROQ_BASE_URL,
+                api_key=GROQ_API_KEY,
+                http_client=openai.DefaultAsyncHttpxClient(
+                    **self._client_args(self.openai_stats)
+                ),
+            )
+        return self._openai
+
+    @property
+    def genai(self) -> genai.Client:
+        if self._genai is None:
+            self._genai = genai.Client(
+                api_key=GEMINI_API_KEY,
+                http_options=types.HttpOptions(
+                    async_client_args=self._client_args(self.genai_stats)
+                ),
+            )
+        return self._genai
+
+    async def close(self):
+        logger.info(f"🔌 Groq HTTP: {self.openai_stats}")
+        logger.info(f"🔌 Gemini HTTP: {self.genai_stats}")
+        if self._openai:
+            await self._openai.close()
+            self._openai = None
+        if self._genai:
+            # google-genai 1.11 에는 client 를 닫는 public API 가 없어 내부 httpx client 를 직접 닫음
+            api_client = self._genai._api_client
+            await api_client._async_httpx_client.aclose()
+            api_client._httpx_client.close()
+            self._genai = None
+
+
+llm_clients = LLMClients()
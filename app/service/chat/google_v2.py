@@ -1,61 +1,126 @@
+import logging
 from time import time
 
-from google import genai
-
-from app.config import GEMINI_API_KEY
+from app.config import (
+    CHAT_HISTORY_TOKENS,
+    GEMINI_CACHE_MIN_TOKENS,
+    GEMINI_PREFIX_CACHE,
+)
 from app.util.time import log_time
 
+from .client import llm_clients
 from .google import system_instruction
-from .llm import LLMService
+from .latency import ttft_histogram
+from .llm import SUMMARY_INSTRUCTION, LLMService
 from .message import Messages
+from .prefix import GeminiPrefixCache, PrefixCacheStats
+from .token import estimate_tokens
 from .type import ModelList, Provider
 
+logger = logging.getLogger(__name__)
+
+
+def check_prefix_cache():
+    # 창에 들어가는 최대 토큰 수가 캐시 최소 크기보다 작으면 캐시가 만들어지지 않음
+    if not GEMINI_PREFIX_CACHE:
+        return
+    tokens = CHAT_HISTORY_TOKENS + estimate_tokens(system_instruction)
+    if tokens < GEMINI_CACHE_MIN_TOKENS:
+        logger.warning(
+            f"⚠️ Gemini prefix cache 비활성: 최대 prompt ~{tokens} tokens < "
+            f"GEMINI_CACHE_MIN_TOKENS {GEMINI_CACHE_MIN_TOKENS} "
+            "(CHAT_HISTORY_TOKENS 를 늘려야 함)"
+        )
+
 
 class Google(LLMService):
-    api_key = GEMINI_API_KEY
     config = {
         "system_instruction": system_instruction,
         "max_output_tokens": 256,
     }
+    prefix_cache_stats = PrefixCacheStats("Gemini")
 
     def __init__(
         self,
         messages: Messages = None,
         model: ModelList.Google = ModelList.Google.Gemini_2_Flash_Lite,
     ):
-        self.client = genai.Client(api_key=self.api_key)
+        self.client = llm_clients.genai
         self.messages = self._init_messages(messages, Provider.Google)
         self.model = model
+        self.prefix_cache = None
+        if GEMINI_PREFIX_CACHE:
+            self.prefix_cache = GeminiPrefixCache(self.client, system_instruction)
+
+    def _request(self):
+        contents = self.messages.get(self.model)
+        if not self.prefix_cache:
+            return contents, self.config
 
-    async def send_message_stream(self, message: str):
-        self.messages.add("user", message)
+        name, tail = self.prefix_cache.split(self.model.value, contents)
+        if not name:
+            return contents, self.config
+        # system prompt 는 캐시에 포함되어 있으므로 config 에서 제외
+        config = {
+            "cached_content": name,
+            "max_output_tokens": self.config["max_output_tokens"],
+        }
+        return tail, config
 
+    async def stream_reply(self):
+        contents, config = self._request()
         start_time = time()
         response = await self.client.aio.models.generate_content_stream(
             model=self.model,
-            contents=self.messages.get(),
-            config=self.config,
+            contents=contents,
+            config=config,
         )
 
-        buffer = []
+        ttft = None
+        usage = None
         async for chunk in response:
+            if ttft is None:
+                ttft = time() - start_time
+                ttft_histogram(self.model).record(ttft)
             log_time(start_time, "Google")
             start_time = None
-            yield chunk.text
-            buffer.append(chunk.text)
+            usage = chunk.usage_metadata or usage
+            if chunk.text:
+                yield chunk.text
 
-        self.messages.add("assistant", "".join(buffer))
+        if usage:
+            self._record_usage(usage, ttft)
 
     async def send_message(self, utterance: str):
         self.messages.add("user", utterance)
 
         start_time = time()
+        contents, config = self._request()
         response = await self.client.aio.models.generate_content(
             model=self.model,
-            contents=self.messages.get(),
-            config=self.config,
+            contents=contents,
+            config=config,
         )
         log_time(start_time, self.model.value)
 
         self.messages.add("assistant", response.text)
         return response.text
+
+    def _record_usage(self, usage, ttft: float | None):
+        self.prefix_cache_stats.record(
+            usage.prompt_token_count or 0,
+            usage.cached_content_token_count or 0,
+            ttft or 0,
+        )
+
+    async def close(self):
+        if self.prefix_cache:
+            await self.prefix_cache.close()
+
+    async def summarize(self, text: str) -> str:
+        response = await self.client.aio.models.generate_content(
+            model=self.model,
+            contents=text,
+            config={"system_instruction": SUMMARY_INSTRUCTION},
+        )
+        return response.text
@@ -1,12 +1,12 @@
 from time import time
 
-import openai
-
-from app.config import GROQ_API_KEY
 from app.util.time import log_time
 
-from .llm import LLMService
+from .client import llm_clients
+from .latency import ttft_histogram
+from .llm import SUMMARY_INSTRUCTION, LLMService
 from .message import Messages
+from .prefix import PrefixCacheStats
 from .type import ModelList, Provider
 
 system_instruction_ko = f"""
@@ -35,11 +35,11 @@ Please follow these rules when generating your response:
 
 
 class Groq(LLMService):
-    def __init__(self, messages: Messages = None):
+    # OpenAI 호환 endpoint 의 자동 prompt caching 은 앞부분이 같은 요청에만 적용됨
+    prefix_cache_stats = PrefixCacheStats("Groq")
 
-        self.client = openai.AsyncOpenAI(
-            base_url="https://api.groq.com/openai/v1", api_key=GROQ_API_KEY
-        )
+    def __init__(self, messages: Messages = None):
+        self.client = llm_clients.openai
         self.model = ModelList.Groq.Gemma2_9b_It
         self.messages = self._init_messages(
             messages, Provider.Groq, system_instruction_en
@@ -50,7 +50,7 @@ class Groq(LLMService):
 
         start_time = time()
         response = await self.client.chat.completions.create(
-            model=self.model, messages=self.messages.get()
+            model=self.model, messages=self.messages.get(self.model)
         )
         log_time(start_time, "Groq")
 
@@ -59,21 +59,42 @@ class Groq(LLMService):
 
         return answer
 
-    async def send_message_stream(self, message: str):
-        self.messages.add_user_input(message)
-
+    async def stream_reply(self):
         start_time = time()
         stream = await self.client.chat.completions.create(
-            model=self.model, messages=self.messages.get(), stream=True
+            model=self.model,
+            messages=self.messages.get(self.model),
+            stream=True,
+            stream_options={"include_usage": True},
         )
 
-        buffer = []
+        ttft = None
         async for chunk in stream:
+            if chunk.usage:
+                self._record_usage(chunk.usage, ttft)
+            if not chunk.choices:
+                continue
+
+            if ttft is None:
+                ttft = time() - start_time
+                ttft_histogram(self.model).record(ttft)
             log_time(start_time, "Groq")
             start_time = None
             answer = chunk.choices[0].delta.content
-            if answer is not None:
+            if answer:
                 yield answer
-                buffer.append(answer)
 
-        self.messages.add_model_output("".join(buffer))
+    def _record_usage(self, usage, ttft: float | None):
+        details = usage.prompt_tokens_details
+        cached_tokens = details.cached_tokens or 0 if details else 0
+        self.prefix_cache_stats.record(usage.prompt_tokens, cached_tokens, ttft or 0)
+
+    async def summarize(self, text: str) -> str:
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": SUMMARY_INSTRUCTION},
+                {"role": "user", "content": text},
+            ],
+        )
+        return response.choices[0].message.content
@@ -0,0 +1,109 @@
+import asyncio
+import logging
+from time import time
+from typing import AsyncIterator
+
+from app.config import LLM_HEDGE_DEADLINE, LLM_HEDGE_MIN_SAMPLES, LLM_HEDGE_PERCENTILE
+
+from .latency import ttft_histogram
+from .llm import LLMService
+
+logger = logging.getLogger(__name__)
+
+
+async def _first_chunk(stream: AsyncIterator[str]) -> str | None:
+    try:
+        return await anext(stream)
+    except StopAsyncIteration:
+        return None
+
+
+class HedgedLLM(LLMService):
+    # primary 의 첫 토큰이 deadline 안에 오지 않으면 같은 기록으로 secondary 를 시작하고,
+    # 먼저 응답한 쪽만 사용 (기록에는 이긴 응답만 추가됨)
+    def __init__(self, primary: LLMService, secondary: LLMService):
+        self.primary = primary
+        self.secondary = secondary
+        self.messages = primary.messages
+        self.last_model = None  # 마지막 응답을 실제로 만든 모델
+
+    @property
+    def model(self):
+        return self.primary.model
+
+    def deadline(self) -> float:
+        histogram = ttft_histogram(self.primary.model)
+        if histogram.count < LLM_HEDGE_MIN_SAMPLES:
+            return LLM_HEDGE_DEADLINE
+        return histogram.percentile(LLM_HEDGE_PERCENTILE)
+
+    async def send_message(self, utterance: str):
+        return await self.primary.send_message(utterance)
+
+    async def summarize(self, text: str) -> str:
+        return await self.primary.summarize(text)
+
+    async def stream_reply(self):
+        primary = self.primary.stream_reply()
+        primary_task = asyncio.create_task(_first_chunk(primary))
+        streams = {primary_task: primary}
+        started = {primary_task: (self.primary.model, time())}
+
+        done, _ = await asyncio.wait({primary_task}, timeout=self.deadline())
+        if not done or primary_task.exception():
+            secondary = self.secondary.stream_reply()
+            secondary_task = asyncio.create_task(_first_chunk(secondary))
+            streams[secondary_task] = secondary
+            started[secondary_task] = (self.secondary.model, time())
+            logger.debug(f"🏁 LLM hedge: {self.secondary.model.value} 시작")
+
+        self.last_model = None
+        winner, first = await self._race(streams, started)
+        if winner is primary:
+            self.last_model = self.primary.model
+        else:
+            self.last_model = self.secondary.model
+            logger.debug(f"🏁 LLM hedge: {self.secondary.model.value} 응답 사용")
+        if first is None:
+            return
+
+        try:
+            yield first
+            async for chunk in winner:
+                yield chunk
+        finally:
+            await winner.aclose()
+
+    async def _race(
+        self,
+        streams: dict[asyncio.Task, AsyncIterator[str]],
+        started: dict[asyncio.Task, tuple],
+    ):
+        pending = set(streams)
+        winner = None
+        error = None
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception():
+                        error = error or task.exception()
+                    elif winner is None:
+                        winner = task
+        finally:
+            # 진 쪽은 취소하고 스트림을 닫아 연결을 반환
+            for task in pending:
+                task.cancel()
+                # 빠른 응답만 남아 deadline 이 계속 줄어들지 않도록 경과 시간을 하한으로 기록
+                model, start_time = started[task]
+                ttft_histogram(model).record(time() - start_time, censored=True)
+            await asyncio.gather(*pending, return_exceptions=True)
+            for task, stream in streams.items():
+                if task is not winner:
+                    await stream.aclose()
+
+        if winner is None:
+            raise error
+        return streams[winner], winner.result()
@@ -0,0 +1,55 @@
+import logging
+from bisect import bisect_left
+from math import inf
+
+from .type import Model
+
+logger = logging.getLogger(__name__)
+
+BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0)  # seconds
+STATS_INTERVAL = 50  # 기록 수
+
+
+class LatencyHistogram:
+    def __init__(self, name: str):
+        self.name = name
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.censored = 0
+
+    def record(self, seconds: float, censored: bool = False):
+        # censored: 첫 토큰 전에 취소된 요청, 실제 지연은 seconds 이상
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.censored += censored
+        if self.count % STATS_INTERVAL == 0:
+            logger.debug(f"📊 {self.name} TTFT: {self}")
+
+    def percentile(self, p: float) -> float | None:
+        # 해당 구간의 상한을 반환 (deadline 을 보수적으로 잡기 위해)
+        if not self.count:
+            return None
+
+        target = self.count * p / 100
+        total = 0
+        for bound, count in zip(BUCKETS + (inf,), self.counts):
+            total += count
+            if total >= target:
+                return bound
+
+    def __str__(self):
+        percentiles = ", ".join(
+            f"p{p} ≤{self.percentile(p) * 1000:.0f}ms" for p in (50, 90, 99)
+        )
+        return f"{percentiles} (n={self.count}, censored={self.censored})"
+
+
+# 모델별 첫 토큰 지연
+_ttft_histograms: dict[str, LatencyHistogram] = {}
+
+
+def ttft_histogram(model: Model) -> LatencyHistogram:
+    histogram = _ttft_histograms.get(model.value)
+    if histogram is None:
+        histogram = _ttft_histograms[model.value] = LatencyHistogram(model.value)
+    return histogram
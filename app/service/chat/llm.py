@@ -1,23 +1,49 @@
 from abc import ABC, abstractmethod
+from typing import AsyncIterator
 
 from .message import Messages
 from .type import Provider
 
+SUMMARY_INSTRUCTION = (
+    "다음 대화를 이후 대화에 필요한 사실과 맥락 위주로 세 문장 이내로 요약해 주세요."
+)
+
 
 class LLMService(ABC):
     def _init_messages(
         self, messages: Messages | None, provider: Provider, system_prompt: str = None
     ):
         if not messages:
-            return Messages(provider, system_prompt)
-        messages.system_prompt = system_prompt
-        messages.provider = provider
+            messages = Messages(provider, system_prompt)
+        else:
+            messages.provider = provider
+            messages.system_prompt = system_prompt
+        messages.summarizer = self.summarize
         return messages
 
     @abstractmethod
     async def send_message(self, utterance: str):
         pass
 
-    @abstractmethod
     async def send_message_stream(self, message: str):
+        self.messages.add_user_input(message)
+
+        buffer = []
+        async for chunk in self.stream_reply():
+            yield chunk
+            buffer.append(chunk)
+
+        self.messages.add_model_output("".join(buffer))
+
+    @abstractmethod
+    def stream_reply(self) -> AsyncIterator[str]:
+        # 현재 messages 에 대한 응답을 스트리밍 (기록은 호출한 쪽에서 추가)
+        pass
+
+    @abstractmethod
+    async def summarize(self, text: str) -> str:
+        pass
+
+    async def close(self):
+        # 세션 종료나 모델 변경으로 더 이상 사용하지 않을 때 provider 쪽 자원 정리
         pass
@@ -1,6 +1,14 @@
-from dataclasses import dataclass
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
 
-from .type import Provider
+from app.config import CHAT_HISTORY_SUMMARY, CHAT_HISTORY_TOKENS
+
+from .token import estimate_tokens
+from .type import Model, ModelList, Provider
+
+logger = logging.getLogger(__name__)
 
 ROLE_MAP = {
     Provider.Google: {
@@ -9,11 +17,23 @@ ROLE_MAP = {
     },
 }
 
+# 모델별 대화 기록 토큰 예산 (context window 가 작은 모델은 더 작게)
+MODEL_TOKEN_BUDGET = {
+    ModelList.Groq.Llama3_8b_8192: min(CHAT_HISTORY_TOKENS, 4000),
+    ModelList.Groq.Gemma2_9b_It: min(CHAT_HISTORY_TOKENS, 4000),
+}
+
+SUMMARY_PREFIX = "이전 대화 요약: "
+
 
 @dataclass
 class Message:
     role: str
     content: str
+    tokens: int = field(init=False)
+
+    def __post_init__(self):
+        self.tokens = estimate_tokens(self.content)
 
     def to_dict(self, provider: Provider) -> dict:
         if provider is Provider.Google:
@@ -29,19 +49,35 @@ class Messages:
     def __init__(self, provider: Provider, system_prompt: str = None):
         self.messages: list[Message] = []
         self._provider = provider
-        self._system_prompt = system_prompt
-        self._cache = self._init_cache()
-
-    def _init_cache(self) -> list[dict]:
-        cache = []
-        if self._system_prompt and self._provider is Provider.Groq:
-            cache.append({"role": "system", "content": self._system_prompt})
+        # provider 별 system prompt 와 dict 캐시 (hedge 시 두 provider 가 같은 기록을 사용)
+        self._system_prompts: dict[Provider, str] = {provider: system_prompt}
+        self._caches: dict[Provider, list[dict]] = {}
+
+        # 요약된 메시지 수와 요약 결과
+        self.summarizer: Callable[[str], Awaitable[str]] = None
+        self._summary: str = None
+        self._summarized = 0
+        self._summary_task: asyncio.Task = None
+        self._summary_end = 0
+        self._summary_stale = False
+
+        self._start = 0
+        self.last_prompt_tokens = 0
+
+    def _system_entries(self, provider: Provider) -> list[dict]:
+        system_prompt = self._system_prompts.get(provider)
+        if system_prompt and provider is Provider.Groq:
+            return [{"role": "system", "content": system_prompt}]
+        return []
+
+    def _cache(self, provider: Provider) -> list[dict]:
+        cache = self._caches.setdefault(provider, [])
+        size = len(cache)
+        cache.extend(message.to_dict(provider) for message in self.messages[size:])
         return cache
 
     def add(self, role: str, content: str):
-        message = Message(role, content)
-        self.messages.append(message)
-        self._cache.append(message.to_dict(self._provider))
+        self.messages.append(Message(role, content))
 
     def add_user_input(self, input: str):
         self.add("user", input)
@@ -49,13 +85,111 @@ class Messages:
     def add_model_output(self, output: str):
         self.add("assistant", output)
 
-    def get(self):
-        return self._cache
+    def get(self, model: Model = None):
+        provider = model.provider() if model else self._provider
+        budget = MODEL_TOKEN_BUDGET.get(model, CHAT_HISTORY_TOKENS)
+        start = self._window_start(budget)
+        if CHAT_HISTORY_SUMMARY and self.summarizer:
+            if start > self._summarized:
+                self._summarize(start)
+            # 아직 요약되지 않은 메시지는 요약이 끝날 때까지 창에 남겨 빠지는 기록이 없게 함
+            start = min(start, self._summarized)
+
+        prompt = self._system_entries(provider)
+        window = self._cache(provider)[start:]
+        summary = self._summary_message(start, provider)
+        if summary and provider is Provider.Google and window:
+            # Gemini 는 user turn 이 연속되지 않도록 창의 첫 user turn 에 합침
+            window = [self._prepend_summary(window[0], summary), *window[1:]]
+        elif summary:
+            prompt.append(summary.to_dict(provider))
+        prompt.extend(window)
+
+        self._track_prompt(start, provider, summary)
+        return prompt
+
+    def _prepend_summary(self, content: dict, summary: Message) -> dict:
+        if content["role"] != "user":
+            return content
+        return {"role": "user", "parts": [{"text": summary.content}, *content["parts"]]}
+
+    def _window_start(self, budget: int) -> int:
+        # provider 의 prefix cache 가 맞도록 예산을 넘기 전까지는 창의 시작을 고정
+        size = len(self.messages)
+        start = min(self._start, size)
+        if sum(message.tokens for message in self.messages[start:]) <= budget:
+            return start
+
+        # 예산을 넘으면 절반만 남기고 한 번에 당김 (마지막 메시지는 항상 포함)
+        start = size
+        tokens = 0
+        while start > 0:
+            tokens += self.messages[start - 1].tokens
+            if tokens > budget // 2 and start < size:
+                break
+            start -= 1
+
+        # 창은 사용자 메시지로 시작
+        while start < size - 1 and self.messages[start].role != "user":
+            start += 1
+        self._start = start
+        return start
+
+    def _summary_message(self, start: int, provider: Provider) -> Message | None:
+        if not self._summary or start == 0:
+            return None
+        role = "system" if provider is Provider.Groq else "user"
+        return Message(role, SUMMARY_PREFIX + self._summary)
+
+    def _track_prompt(self, start: int, provider: Provider, summary: Message | None):
+        tokens = sum(message.tokens for message in self.messages[start:])
+        system_prompt = self._system_prompts.get(provider)
+        if system_prompt and provider is Provider.Groq:
+            tokens += estimate_tokens(system_prompt)
+        if summary:
+            tokens += summary.tokens
+
+        self.last_prompt_tokens = tokens
+        logger.debug(
+            f"📝 LLM prompt: ~{tokens} tokens, "
+            f"{len(self.messages) - start}/{len(self.messages)} messages"
+        )
+
+    def _summarize(self, end: int):
+        if not self.summarizer or self._summary_task:
+            return
+
+        # 응답 경로를 막지 않도록 백그라운드에서 요약하고, 다음 요청부터 사용
+        messages = self.messages[self._summarized : end]
+        text = "\n".join(f"{message.role}: {message.content}" for message in messages)
+        if self._summary:
+            text = SUMMARY_PREFIX + self._summary + "\n" + text
+        self._summary_end = end
+        self._summary_stale = False
+        self._summary_task = asyncio.create_task(self._run_summary(text, end))
+
+    async def _run_summary(self, text: str, end: int):
+        try:
+            summary = await self.summarizer(text)
+            if self._summary_stale:
+                # 요약 중에 대상 메시지가 pop 으로 되돌려졌으면 결과를 버림
+                return
+            self._summary = summary
+            self._summarized = end
+            logger.debug(f"🗜️ 대화 요약: {self._summarized} messages")
+        except Exception as e:
+            logger.warning(f"⚠️ 대화 요약 실패: {e}")
+        finally:
+            self._summary_task = None
 
     def pop(self):
         if self.messages:
             message = self.messages.pop()
-            self._cache.pop()
+            for cache in self._caches.values():
+                del cache[len(self.messages) :]
+            self._summarized = min(self._summarized, len(self.messages))
+            if self._summary_task and len(self.messages) < self._summary_end:
+                self._summary_stale = True
             return message
         return None
 
@@ -70,13 +204,11 @@ class Messages:
     @provider.setter
     def provider(self, provider: Provider):
         self._provider = provider
-        self._cache = self._init_cache()
-        self._cache.extend(message.to_dict(self._provider) for message in self.messages)
 
     @property
     def system_prompt(self) -> str:
-        return self._system_prompt
+        return self._system_prompts.get(self._provider)
 
     @system_prompt.setter
     def system_prompt(self, system_prompt: str):
-        self._system_prompt = system_prompt
+        self._system_prompts[self._provider] = system_prompt
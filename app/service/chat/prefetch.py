@@ -0,0 +1,30 @@
+import asyncio
+from typing import AsyncIterator
+
+
+class PrefetchedResponse:
+    def __init__(self, utterance: str, sentences: AsyncIterator[str], history_size: int):
+        self.utterance = utterance
+        self.history_size = history_size
+        self.queue = asyncio.Queue()
+        self.task = asyncio.create_task(self._run(sentences))
+
+    async def _run(self, sentences: AsyncIterator[str]):
+        try:
+            async for sentence in sentences:
+                await self.queue.put(sentence)
+            await self.queue.put(None)
+        except Exception as e:
+            await self.queue.put(e)
+
+    async def sentences(self):
+        while True:
+            sentence = await self.queue.get()
+            if sentence is None:
+                return
+            if isinstance(sentence, Exception):
+                raise sentence
+            yield sentence
+
+    def cancel(self):
+        self.task.cancel()
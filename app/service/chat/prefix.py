@@ -0,0 +1,160 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from google import genai
+from google.genai import errors, types
+
+from app.config import GEMINI_CACHE_MIN_TOKENS, GEMINI_CACHE_TTL
+
+from .token import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+STATS_INTERVAL = 20  # 요청 수
+REFRESH_MESSAGES = 6  # 캐시 뒤에 붙는 메시지가 이만큼 쌓이면 캐시를 다시 만듦
+EXPIRE_MARGIN = timedelta(seconds=30)
+RETRY_BACKOFF = (10, 300)  # 일시적인 오류 후 재시도 간격 (seconds, 최소/최대)
+UNSUPPORTED_CODES = (400, 403, 404)
+
+
+class PrefixCacheStats:
+    def __init__(self, name: str):
+        self.name = name
+        self.requests = 0
+        self.hits = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self.ttft = 0.0
+
+    def record(self, prompt_tokens: int, cached_tokens: int, ttft: float):
+        self.requests += 1
+        self.hits += cached_tokens > 0
+        self.prompt_tokens += prompt_tokens
+        self.cached_tokens += cached_tokens
+        self.ttft += ttft
+
+        if self.requests % STATS_INTERVAL == 0:
+            logger.debug(f"🧊 {self.name} prefix cache: {self}")
+
+    def __str__(self):
+        requests = max(1, self.requests)
+        return (
+            f"hit {self.hits}/{self.requests}, "
+            f"cached tokens {self.cached_tokens}/{self.prompt_tokens}, "
+            f"avg TTFT {self.ttft / requests * 1000:.0f}ms"
+        )
+
+
+class GeminiPrefixCache:
+    # system prompt + 고정된 대화 기록 앞부분을 Gemini context cache 로 만들어 재사용
+    def __init__(self, client: genai.Client, system_instruction: str):
+        self.client = client
+        self.system_instruction = system_instruction
+        self.model: str = None
+        self.name: str = None
+        self.prefix: list[dict] = []
+        self.expire_time: datetime = None
+        self.unsupported: set[str] = set()
+        self._refresh_task: asyncio.Task = None
+        self._backoff = 0
+        self._retry_at: datetime = None
+
+    def split(self, model: str, contents: list[dict]) -> tuple[str | None, list[dict]]:
+        # (cache 이름, 캐시 뒤에 보낼 contents) 를 반환, 캐시를 못 쓰면 (None, contents)
+        name = self.name if self._matches(model, contents) else None
+        tail = contents[len(self.prefix) :] if name else contents
+
+        if name is None or len(tail) >= REFRESH_MESSAGES:
+            self._refresh(model, contents)
+        return name, tail
+
+    def _matches(self, model: str, contents: list[dict]) -> bool:
+        if not self.name or self.model != model:
+            return False
+        if datetime.now(timezone.utc) >= self.expire_time - EXPIRE_MARGIN:
+            return False
+        return contents[: len(self.prefix)] == self.prefix
+
+    def _refresh(self, model: str, contents: list[dict]):
+        if self._refresh_task or model in self.unsupported:
+            return
+        if self._retry_at and datetime.now(timezone.utc) < self._retry_at:
+            return
+
+        tokens = estimate_tokens(self.system_instruction) + sum(
+            estimate_tokens(content["parts"][0]["text"]) for content in contents
+        )
+        if tokens < GEMINI_CACHE_MIN_TOKENS:
+            return
+
+        # 응답 경로를 막지 않도록 백그라운드에서 생성, 다음 요청부터 사용
+        self._refresh_task = asyncio.create_task(self._create(model, list(contents)))
+
+    async def _create(self, model: str, contents: list[dict]):
+        try:
+            cache = await self.client.aio.caches.create(
+                model=model,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=self.system_instruction,
+                    contents=contents,
+                    ttl=f"{GEMINI_CACHE_TTL}s",
+                ),
+            )
+        except Exception as e:
+            self._on_create_failed(model, e)
+            return
+        finally:
+            self._refresh_task = None
+
+        self._backoff = 0
+        self._retry_at = None
+
+        old_name = self.name
+        self.model = model
+        self.name = cache.name
+        self.prefix = contents
+        self.expire_time = cache.expire_time or (
+            datetime.now(timezone.utc) + timedelta(seconds=GEMINI_CACHE_TTL)
+        )
+        logger.debug(f"🧊 Gemini cache 생성: {len(contents)} messages")
+
+        if old_name:
+            await self.delete(old_name)
+
+    def _on_create_failed(self, model: str, error: Exception):
+        # 모델이 캐시를 지원하지 않는 등 확실한 4xx 만 영구히 끄고, 나머지는 backoff 후 재시도
+        too_small = "too small" in str(error).lower() or "minimum" in str(error).lower()
+        if (
+            isinstance(error, errors.ClientError)
+            and error.code in UNSUPPORTED_CODES
+            and not too_small
+        ):
+            logger.warning(f"⚠️ Gemini cache 미지원 ({model}): {error}")
+            self.unsupported.add(model)
+            return
+
+        minimum, maximum = RETRY_BACKOFF
+        self._backoff = min(maximum, self._backoff * 2 or minimum)
+        self._retry_at = datetime.now(timezone.utc) + timedelta(seconds=self._backoff)
+        logger.warning(
+            f"⚠️ Gemini cache 생성 실패 ({model}), {self._backoff}s 후 재시도: {error}"
+        )
+
+    async def close(self):
+        # 생성 중인 캐시가 있으면 끝난 뒤 함께 삭제 (TTL 까지 서버에 남지 않도록)
+        if self._refresh_task:
+            await asyncio.gather(self._refresh_task, return_exceptions=True)
+        await self.delete()
+
+    async def delete(self, name: str = None):
+        name = name or self.name
+        if not name:
+            return
+        if name == self.name:
+            self.name = None
+            self.prefix = []
+        try:
+            await self.client.aio.caches.delete(name=name)
+        except Exception as e:
+            logger.warning(f"⚠️ Gemini cache 삭제 실패: {e}")
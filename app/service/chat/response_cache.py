@@ -0,0 +1,107 @@
+import hashlib
+import logging
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from time import time
+
+from app.config import (
+    RESPONSE_CACHE_CONTEXT,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RESPONSE_CACHE_MAX_TEXT,
+    RESPONSE_CACHE_TTL,
+)
+
+from .message import Message
+from .type import Model
+
+logger = logging.getLogger(__name__)
+
+NORMALIZE_PATTERN = re.compile(r"[\s.,!?~…]+")
+STATS_INTERVAL = 50  # 조회 수
+
+
+@dataclass
+class CachedResponse:
+    segments: list[str]
+    text: str
+    first_segment_time: float  # 원래 응답의 첫 문장까지 걸린 시간 (seconds)
+    created: float = field(default_factory=time)
+
+
+class ResponseCache:
+    # 자주 나오는 짧은 발화의 LLM 응답을 (발화, 직전 대화, 모델) 기준으로 재사용
+    def __init__(
+        self,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        max_text: int = RESPONSE_CACHE_MAX_TEXT,
+        ttl: float = RESPONSE_CACHE_TTL,
+        context: int = RESPONSE_CACHE_CONTEXT,
+    ):
+        self.max_entries = max_entries
+        self.max_text = max_text
+        self.ttl = ttl
+        self.context = context
+
+        self.responses: OrderedDict[str, CachedResponse] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.saved = 0.0
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return NORMALIZE_PATTERN.sub("", text).lower()
+
+    def cacheable(self, utterance: str) -> bool:
+        return 0 < len(self.normalize(utterance)) <= self.max_text
+
+    def key(self, utterance: str, history: list[Message], model: Model) -> str:
+        # 직전 대화가 다르면 같은 발화라도 다른 응답이 필요 ("다시 말해 줄래?" 등)
+        history = history[-self.context :] if self.context else []
+        context = "|".join(f"{message.role}:{message.content}" for message in history)
+        content = f"{model.value}|{self.normalize(utterance)}|{context}"
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def peek(self, key: str) -> CachedResponse | None:
+        response = self.responses.get(key)
+        if response and time() - response.created > self.ttl:
+            del self.responses[key]
+            return None
+        return response
+
+    def get(self, key: str) -> CachedResponse | None:
+        response = self.peek(key)
+        if response is None:
+            self.misses += 1
+        else:
+            self.responses.move_to_end(key)
+            self.hits += 1
+            self.saved += response.first_segment_time
+
+        if (self.hits + self.misses) % STATS_INTERVAL == 0:
+            logger.debug(f"💬 LLM response cache: {self.stats}")
+        return response
+
+    def put(self, key: str, segments: list[str], text: str, first_segment_time: float):
+        self.responses[key] = CachedResponse(
+            segments=segments,
+            text=text,
+            first_segment_time=first_segment_time,
+        )
+        self.responses.move_to_end(key)
+        while len(self.responses) > self.max_entries:
+            self.responses.popitem(last=False)
+
+    @property
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "responses": len(self.responses),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "saved_ms": round(self.saved * 1000),
+        }
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,101 @@
+from typing import Iterator
+
+from app.config import SENTENCE_MAX_LENGTH, SENTENCE_MIN_LENGTH
+
+TERMINATORS = frozenset(".?!…~。？！")
+CLOSERS = frozenset(")]」』”’")
+QUOTES = frozenset("\"'")
+CLAUSE_BREAKS = frozenset(",，")
+KOREAN_ENDINGS = frozenset("다요죠까네")
+
+
+class SentenceSegmenter:
+    # LLM 스트림을 새로 들어온 글자만 훑으며 TTS 로 보낼 문장 단위로 자름
+    def __init__(
+        self,
+        min_length: int = SENTENCE_MIN_LENGTH,
+        max_length: int = SENTENCE_MAX_LENGTH,
+    ):
+        self.min_length = min_length
+        self.max_length = max_length
+        self.buffer = ""
+        self.scanned = 0
+        self.in_terminal = False
+
+        # 마지막 문장 끝 / 절 끝(쉼표, "~다 ") / 공백 위치
+        self.boundary = 0
+        self.clause = 0
+        self.space = 0
+
+    def feed(self, chunk: str) -> Iterator[str]:
+        self.buffer += chunk
+        self._scan()
+
+        while True:
+            if self.boundary and self.boundary >= self.min_length:
+                end = self.boundary
+            elif len(self.buffer) >= self.max_length:
+                end = self.clause or self.space or self.scanned
+            else:
+                return
+
+            if not end:
+                return
+            segment = self._cut(end)
+            if segment.strip():
+                yield segment
+
+    def flush(self) -> str | None:
+        segment = self._cut(len(self.buffer))
+        self.in_terminal = False
+        return segment if segment.strip() else None
+
+    def _scan(self):
+        buffer = self.buffer
+        size = len(buffer)
+        i = self.scanned
+        while i < size:
+            c = buffer[i]
+            if c == "." and i > 0 and buffer[i - 1].isdigit():
+                # "3.5" 같은 소수점인지는 다음 글자를 봐야 알 수 있음
+                if i + 1 == size:
+                    break
+                if buffer[i + 1].isdigit():
+                    i += 1
+                    continue
+
+            if self.in_terminal and c in QUOTES:
+                # 여는 따옴표와 구분하기 위해 뒤에 공백이 오는지 확인
+                if i + 1 == size:
+                    break
+                if buffer[i + 1].isspace():
+                    i += 1
+                    continue
+
+            if c in TERMINATORS or (self.in_terminal and c in CLOSERS):
+                # "..." / "?!" / '."' 는 끝까지 이어서 하나의 문장 끝으로 취급
+                self.in_terminal = True
+                i += 1
+                continue
+
+            if self.in_terminal:
+                self.in_terminal = False
+                self.boundary = i
+
+            if c in CLAUSE_BREAKS:
+                self.clause = i + 1
+            elif c.isspace():
+                self.space = i
+                if i > 0 and buffer[i - 1] in KOREAN_ENDINGS:
+                    self.clause = i
+            i += 1
+
+        self.scanned = i
+
+    def _cut(self, end: int) -> str:
+        segment, self.buffer = self.buffer[:end], self.buffer[end:]
+        self.scanned = max(0, self.scanned - end)
+        self.boundary = max(0, self.boundary - end)
+        self.clause = max(0, self.clause - end)
+        self.space = max(0, self.space - end)
+        return segment
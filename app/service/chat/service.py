@@ -1,37 +1,74 @@
 import asyncio
 import logging
 import re
+from time import time
 
+from app.config import LLM_HEDGE, LLM_HEDGE_MODEL, RESPONSE_CACHE
 from app.websocket.emit import emit_speech_message
 
 from .google_v2 import Google
 from .groq import Groq
-from .type import Model, Provider
+from .hedge import HedgedLLM
+from .llm import LLMService
+from .prefetch import PrefetchedResponse
+from .response_cache import CachedResponse, response_cache
+from .segment import SentenceSegmenter
+from .type import Model, ModelList, Provider
 
 logger = logging.getLogger(__name__)
 
 
 class ChatService:
-    LAST_PUNCTUATION_PATTERN = re.compile(r"[.?!](?!.*[.?!])\s*")
     PUNCTUATION_WITH_SPACES_PATTERN = re.compile(r"^\s+|([,.!?])\s+")
+    ERROR_MESSAGE = "서버 오류가 발생했습니다.잠시 후 다시 시도해 주세요."
 
     def __init__(self, sid):
         self.sid = sid
         self.llm = Groq()
         self.messages = self.llm.messages
+        self.hedge = self._create_hedge()
         self._emit_task = None
+        self._prefetch: PrefetchedResponse = None
 
-    def change_model(self, model: Model):
+    async def change_model(self, model: Model):
         provider = model.provider()
+        llm, hedge = self.llm, self.hedge
 
         if self.llm.model.provider() == provider:
             self.llm.model = model
-            return
-
-        if provider == Provider.Google:
-            self.llm = Google(self.messages, model)
-        elif provider == Provider.Groq:
-            self.llm = Groq(self.messages)
+        else:
+            self.llm = self._create_llm(model)
+        self.hedge = self._create_hedge()
+
+        # 교체된 LLM 이 만든 Gemini context cache 는 TTL 을 기다리지 않고 삭제
+        if llm is not self.llm:
+            await llm.close()
+        if hedge:
+            await hedge.secondary.close()
+
+    async def close(self):
+        await self.llm.close()
+        if self.hedge:
+            await self.hedge.secondary.close()
+
+    def _create_llm(self, model: Model) -> LLMService:
+        if model.provider() == Provider.Google:
+            return Google(self.messages, model)
+
+        llm = Groq(self.messages)
+        llm.model = model
+        return llm
+
+    def _create_hedge(self) -> HedgedLLM | None:
+        model = ModelList.find(LLM_HEDGE_MODEL)
+        if not LLM_HEDGE or not model or model == self.llm.model:
+            return None
+
+        secondary = self._create_llm(model)
+        # secondary 생성으로 바뀐 기본 provider 와 요약 모델을 primary 로 되돌림
+        self.messages.provider = self.llm.model.provider()
+        self.messages.summarizer = self.llm.summarize
+        return HedgedLLM(self.llm, secondary)
 
     def _emit_response(self, message: str):
         self._emit_task = asyncio.create_task(
@@ -51,39 +88,102 @@ class ChatService:
 
         except Exception as e:
             logger.error(f"⚠️ LLM Error: {e}")
-            result = "서버 오류가 발생했습니다.잠시 후 다시 시도해 주세요."
+            result = self.ERROR_MESSAGE
 
         yield result
 
-    async def send_utterance_stream(self, utterance: str):
-        try:
-            response = self.llm.send_message_stream(utterance)
+    def prefetch_utterance(self, utterance: str):
+        if self._prefetch and self._prefetch.utterance == utterance:
+            return
+        self.discard_prefetch()
+        self._prefetch = PrefetchedResponse(
+            utterance, self._stream_sentences(utterance), len(self.messages.messages)
+        )
+
+    def discard_prefetch(self):
+        prefetch, self._prefetch = self._prefetch, None
+        if not prefetch:
+            return
+
+        prefetch.cancel()
+        while len(self.messages.messages) > prefetch.history_size:
+            self.messages.pop()
+        logger.debug(f"🗑️ LLM prefetch 폐기: {prefetch.utterance}")
 
-            buffer = ""
-            async for chunk in response:
-                buffer += chunk
-                result, buffer = self._slice_sentences(buffer)
-                if result:
-                    yield result
+    def _take_prefetch(self, utterance: str):
+        if self._prefetch and self._prefetch.utterance == utterance:
+            prefetch, self._prefetch = self._prefetch, None
+            return prefetch.sentences()
 
-            while buffer:
-                result, buffer = self._slice_sentences(buffer)
-                if not result:
-                    break
-                yield result
+        self.discard_prefetch()
+        return None
 
-            self._emit_response(self.messages.last_message.content)
+    def has_cached_response(self, utterance: str) -> bool:
+        cache_key = self._response_cache_key(utterance)
+        return bool(cache_key and response_cache.peek(cache_key))
+
+    def _response_cache_key(self, utterance: str) -> str | None:
+        if not RESPONSE_CACHE or not response_cache.cacheable(utterance):
+            return None
+
+        # prefetch 가 미리 추가한 기록은 제외
+        history = self.messages.messages
+        if self._prefetch:
+            history = history[: self._prefetch.history_size]
+        return response_cache.key(utterance, history, self.llm.model)
+
+    async def send_utterance_stream(self, utterance: str):
+        start_time = time()
+        try:
+            cache_key = self._response_cache_key(utterance)
+            cached = response_cache.get(cache_key) if cache_key else None
+            if cached:
+                self.discard_prefetch()
+                sentences = self._replay_response(utterance, cached)
+            else:
+                sentences = self._take_prefetch(utterance)
+                if sentences is None:
+                    sentences = self._stream_sentences(utterance)
+
+            first_sentence_time = None
+            segments = []
+            async for sentence in sentences:
+                if first_sentence_time is None:
+                    first_sentence_time = time() - start_time
+                segments.append(sentence)
+                yield sentence
+
+            response = self.messages.last_message.content
+            # hedge 로 다른 모델이 응답했다면 key 와 맞지 않으므로 저장하지 않음
+            answered_by = self.hedge.last_model if self.hedge else self.llm.model
+            stored = not cached and segments and answered_by == self.llm.model
+            if cache_key and stored:
+                response_cache.put(cache_key, segments, response, first_sentence_time)
+            self._emit_response(response)
 
         except Exception as e:
             logger.error(f"⚠️ LLM Error: {e}")
             self.messages.pop()
-            yield "서버 오류가 발생했습니다.잠시 후 다시 시도해 주세요."
+            yield self.ERROR_MESSAGE
+
+    async def _replay_response(self, utterance: str, response: CachedResponse):
+        self.messages.add_user_input(utterance)
+        for segment in response.segments:
+            yield segment
+        self.messages.add_model_output(response.text)
+
+    async def _stream_sentences(self, utterance: str):
+        llm = self.hedge or self.llm
+        response = llm.send_message_stream(utterance)
+
+        segmenter = SentenceSegmenter()
+        async for chunk in response:
+            for sentence in segmenter.feed(chunk):
+                yield self._normalize(sentence)
 
-    def _slice_sentences(self, buffer: str):
-        match = self.LAST_PUNCTUATION_PATTERN.search(buffer)
-        if not match:
-            return (None, buffer)
+        sentence = segmenter.flush()
+        if sentence:
+            yield self._normalize(sentence)
 
-        end_index = match.end()
-        result = self.PUNCTUATION_WITH_SPACES_PATTERN.sub(r"\1", buffer[:end_index])
-        return (result, buffer[end_index:])
+    def _normalize(self, sentence: str):
+        return self.PUNCTUATION_WITH_SPACES_PATTERN.sub(r"\1", sentence)
@@ -0,0 +1,9 @@
+MESSAGE_OVERHEAD = 4  # role, 구분자 등 메시지당 추가 토큰
+
+
+def estimate_tokens(text: str) -> int:
+    # 한글 등 비 ASCII 글자는 글자당 약 1 토큰, ASCII 는 약 4 글자당 1 토큰으로 추정
+    chars = len(text)
+    non_ascii = (len(text.encode("utf-8")) - chars) // 2
+    ascii = max(0, chars - non_ascii)
+    return non_ascii + ascii // 4 + MESSAGE_OVERHEAD
@@ -27,3 +27,11 @@ class ModelList:
         Llama_3Dot1_8b_Instant = "llama-3.1-8b-instant"
         Llama3_8b_8192 = "llama3-8b-8192"
         Gemma2_9b_It = "gemma2-9b-it"
+
+    @staticmethod
+    def find(value: str) -> Model | None:
+        for models in (ModelList.Google, ModelList.Groq):
+            for model in models:
+                if model.value == value:
+                    return model
+        return None
@@ -1,4 +1,11 @@
+from .channel import STTChannelPool, stt_channel_pool
 from .service import STTService
-from .type import STTResult
+from .type import STTResult, STTSegment
 
-__all__ = ["STTService", "STTResult"]
+__all__ = [
+    "STTService",
+    "STTResult",
+    "STTSegment",
+    "STTChannelPool",
+    "stt_channel_pool",
+]
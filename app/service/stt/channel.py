@@ -0,0 +1,129 @@
+import asyncio
+import logging
+
+import grpc
+import grpc.aio
+
+from app.config import (
+    STT_CHANNEL_POOL_SIZE,
+    STT_INSECURE,
+    STT_MAX_STREAMS_PER_CHANNEL,
+    STT_TARGET,
+)
+
+from . import nest_pb2_grpc
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+CHANNEL_OPTIONS = [
+    # 서버 기본 정책 (호출 없는 ping 거부, 최소 5분 간격) 을 넘지 않도록 stream 중에만 ping
+    # 유휴 채널은 acquire 시 상태를 확인해 교체
+    ("grpc.keepalive_time_ms", 300000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    # 채널마다 별도의 HTTP/2 연결을 사용하도록 subchannel 공유 방지
+    ("grpc.use_local_subchannel_pool", 1),
+]
+
+UNHEALTHY_STATES = (
+    grpc.ChannelConnectivity.TRANSIENT_FAILURE,
+    grpc.ChannelConnectivity.SHUTDOWN,
+)
+
+
+class PooledChannel:
+    def __init__(self, target: str, insecure: bool, overflow: bool = False):
+        if insecure:
+            self.channel = grpc.aio.insecure_channel(target, options=CHANNEL_OPTIONS)
+        else:
+            self.channel = grpc.aio.secure_channel(
+                target, grpc.ssl_channel_credentials(), options=CHANNEL_OPTIONS
+            )
+        self.stub = nest_pb2_grpc.NestServiceStub(self.channel)
+        self.streams = 0
+        # 기본 크기를 넘어 추가로 만든 채널 (유휴 상태가 되면 정리)
+        self.overflow = overflow
+
+    @property
+    def healthy(self) -> bool:
+        return self.channel.get_state(try_to_connect=True) not in UNHEALTHY_STATES
+
+
+class STTChannelPool:
+    def __init__(
+        self,
+        target: str = STT_TARGET,
+        size: int = STT_CHANNEL_POOL_SIZE,
+        max_streams: int = STT_MAX_STREAMS_PER_CHANNEL,
+        insecure: bool = STT_INSECURE,
+    ):
+        self.target = target
+        self.size = size
+        self.max_streams = max_streams
+        self.insecure = insecure
+        self.channels: list[PooledChannel] = []
+
+    def _create_channel(self) -> PooledChannel:
+        overflow = len(self.channels) >= self.size
+        channel = PooledChannel(self.target, self.insecure, overflow)
+        self.channels.append(channel)
+        logger.info(f"🔗 gRPC channel opened ({len(self.channels)}): {self.target}")
+        return channel
+
+    async def warm_up(self, timeout: float = 5):
+        while len(self.channels) < self.size:
+            self._create_channel()
+
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(channel.channel.channel_ready(), timeout)
+                for channel in self.channels
+            ),
+            return_exceptions=True,
+        )
+        ready = sum(1 for result in results if not isinstance(result, Exception))
+        logger.info(f"🔥 gRPC channel warm-up: {ready}/{len(self.channels)} ready")
+
+    def acquire(self) -> PooledChannel:
+        self._check_health()
+
+        candidates = [c for c in self.channels if c.streams < self.max_streams]
+        if len(self.channels) < self.size or not candidates:
+            channel = self._create_channel()
+        else:
+            channel = min(candidates, key=lambda c: c.streams)
+
+        channel.streams += 1
+        return channel
+
+    def release(self, channel: PooledChannel):
+        channel.streams -= 1
+
+        # 기본 채널은 유지하고 늘어난 채널만 유휴 상태가 되면 정리
+        if channel.streams == 0 and channel.overflow:
+            self._remove(channel)
+
+    def _check_health(self):
+        for channel in list(self.channels):
+            if channel.streams == 0 and not channel.healthy:
+                logger.warning(f"⚠️ Unhealthy gRPC channel replaced: {self.target}")
+                self._remove(channel)
+
+    def _remove(self, channel: PooledChannel):
+        self.channels.remove(channel)
+        asyncio.create_task(channel.channel.close())
+
+    @property
+    def stats(self) -> dict:
+        return {
+            "channels": len(self.channels),
+            "streams": [channel.streams for channel in self.channels],
+        }
+
+    async def close(self):
+        channels, self.channels = self.channels, []
+        await asyncio.gather(*(channel.channel.close() for channel in channels))
+        logger.info("❌ gRPC channel pool closed")
+
+
+stt_channel_pool = STTChannelPool()
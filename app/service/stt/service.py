@@ -1,13 +1,15 @@
 import json
 import logging
 from os import getenv
+from typing import AsyncIterator
 
 import grpc.aio
 from google import genai
 from google.genai import types
 
-from . import nest_pb2, nest_pb2_grpc
-from .type import STTResult
+from . import nest_pb2
+from .channel import PooledChannel, STTChannelPool, stt_channel_pool
+from .type import STTResult, STTSegment
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -17,17 +19,24 @@ class STTService:
     _METADATA = (("authorization", f"Bearer {getenv("CLOVA_SPEECH_SECRET_KEY")}"),)
     client = genai.Client(api_key=getenv("GEMINI_API_KEY"))
 
-    def __init__(self):
-        self.channel = grpc.aio.secure_channel(
-            "clovaspeech-gw.ncloud.com:50051", grpc.ssl_channel_credentials()
-        )
-        self.stub = nest_pb2_grpc.NestServiceStub(self.channel)
+    def __init__(self, pool: STTChannelPool = stt_channel_pool):
+        self.pool = pool
+        self.channel: PooledChannel = None
 
-    async def close(self):
+    def _acquire(self):
+        self._release()
+        self.channel = self.pool.acquire()
+        return self.channel.stub
+
+    def _release(self):
         if self.channel:
-            await self.channel.close()
+            self.pool.release(self.channel)
             self.channel = None
-            logger.info("❌ gRPC channel closed")
+
+    async def close(self):
+        if self.channel:
+            self._release()
+            logger.info("❌ gRPC stream released")
 
     def _generate_config(self):
         return nest_pb2.NestRequest(
@@ -63,12 +72,13 @@ class STTService:
                 ),
             )
 
-    async def run(self, pcm_iter):
+    async def stream(self, pcm_iter) -> AsyncIterator[STTSegment]:
         buffer = []
 
         try:
             # 서버로부터 응답을 반복 처리
-            responses = self.stub.recognize(
+            stub = self._acquire()
+            responses = stub.recognize(
                 self._generate_requests(pcm_iter), metadata=self._METADATA
             )
             async for response in responses:
@@ -81,16 +91,28 @@ class STTService:
                 text = transcription.get("text")
                 if text:
                     buffer.append(text)
+                    yield STTSegment(text=text, transcript="".join(buffer))
                 else:
                     logger.info(f"response: {content}")
 
+        finally:
+            self._release()
+
+        transcript = "".join(buffer)
+        yield STTSegment(text="", transcript=transcript, final=True)
+
+    async def run(self, pcm_iter, on_segment=None):
+        try:
+            async for segment in self.stream(pcm_iter):
+                if segment.final:
+                    return STTResult(success=True, text=segment.transcript)
+                if on_segment:
+                    await on_segment(segment)
+
         except grpc.aio.AioRpcError as e:
             error_result = await self.handle_error(e.details())
             return error_result
 
-        result = STTResult(success=True, text="".join(buffer))
-        return result
-
     async def handle_error(self, error_details):
         logger.error(f"⚠️ STT Error: {error_details}")
 
@@ -6,3 +6,10 @@ class STTResult:
     success: bool
     text: str = None
     reason: str = None
+
+
+@dataclass
+class STTSegment:
+    text: str
+    transcript: str  # 지금까지 인식된 전체 문장
+    final: bool = False
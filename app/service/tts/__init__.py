@@ -1,4 +1,15 @@
+from .cache import TTSCache, tts_cache
+from .pool import SynthesizerPool, synthesizer_pool
 from .track import TTSAudioTrack
+from .viseme import VISEME_PROTOCOL_VERSION
 from .voice import SynthesisVoiceKorean
 
-__all__ = ["TTSAudioTrack", "SynthesisVoiceKorean"]
+__all__ = [
+    "TTSAudioTrack",
+    "SynthesisVoiceKorean",
+    "SynthesizerPool",
+    "synthesizer_pool",
+    "TTSCache",
+    "tts_cache",
+    "VISEME_PROTOCOL_VERSION",
+]
@@ -0,0 +1,261 @@
+import asyncio
+import hashlib
+import json
+import logging
+import mmap
+import os
+import re
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+
+import azure.cognitiveservices.speech as speechsdk
+
+from app.config import (
+    TTS_CACHE_ADMIT_REPEATS,
+    TTS_CACHE_DIR,
+    TTS_CACHE_DISK_MAX_BYTES,
+    TTS_CACHE_MAX_BYTES,
+    TTS_CACHE_MAX_TEXT,
+)
+
+from .channel import AudioChannel
+from .pool import OUTPUT_FORMAT, synthesizer_pool
+from .viseme import RecordingVisemes, Viseme
+
+logger = logging.getLogger(__name__)
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+SEEN_MAX_KEYS = 10000  # 반복 여부를 판단하려고 기억하는 문장 수
+
+
+@dataclass
+class CachedClip:
+    pcm: bytes | mmap.mmap
+    visemes: list[Viseme]
+
+    @property
+    def size(self) -> int:
+        return len(self.pcm)
+
+
+class TTSCache:
+    def __init__(
+        self,
+        max_bytes: int = TTS_CACHE_MAX_BYTES,
+        max_text: int = TTS_CACHE_MAX_TEXT,
+        directory: str | None = TTS_CACHE_DIR,
+        disk_max_bytes: int = TTS_CACHE_DISK_MAX_BYTES,
+    ):
+        self.max_bytes = max_bytes
+        self.max_text = max_text
+        self.directory = directory
+        self.disk_max_bytes = disk_max_bytes
+
+        self.clips: OrderedDict[str, CachedClip] = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+        # 한 번 합성된 문장 (key → 횟수), 반복된 문장만 캐시에 저장
+        self.seen: OrderedDict[str, int] = OrderedDict()
+        self._save_tasks: set[asyncio.Task] = set()
+
+        # 디스크에 저장된 clip (key → PCM 크기), 메모리와 별도로 LRU 관리
+        self.files: OrderedDict[str, int] = OrderedDict()
+        self.disk_size = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._scan()
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return WHITESPACE_PATTERN.sub(" ", text).strip()
+
+    def key(self, voice: str, text: str) -> str:
+        content = f"{voice}|{self.normalize(text)}|{OUTPUT_FORMAT.name}"
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def cacheable(self, text: str) -> bool:
+        return len(self.normalize(text)) <= self.max_text
+
+    def admit(self, key: str, repeats: int = TTS_CACHE_ADMIT_REPEATS) -> bool:
+        # 같은 문장이 repeats 번째 합성될 때부터 녹음해서 저장
+        count = self.seen.pop(key, 0) + 1
+        self.seen[key] = count
+        if len(self.seen) > SEEN_MAX_KEYS:
+            self.seen.popitem(last=False)
+        return count >= repeats
+
+    def get(self, key: str) -> CachedClip | None:
+        clip = self.clips.get(key)
+        if clip is None and key in self.files:
+            clip = self._load(key)
+            if clip:
+                self._add(key, clip)
+            else:
+                self._remove_file(key)
+
+        if clip is None:
+            self.misses += 1
+            return None
+
+        self.clips.move_to_end(key)
+        if key in self.files:
+            self.files.move_to_end(key)
+        self.hits += 1
+        return clip
+
+    def put(self, key: str, pcm: bytes, visemes: list[Viseme]):
+        # 캐시 전체보다 큰 clip 은 저장하지 않음
+        if key in self.clips or len(pcm) > self.max_bytes:
+            return
+
+        # 호출한 쪽이 이후에 visemes 를 수정해도 캐시에 영향이 없도록 복사
+        clip = CachedClip(pcm=bytes(pcm), visemes=list(visemes))
+        self._add(key, clip)
+        self.seen.pop(key, None)
+
+        if self.directory:
+            task = asyncio.create_task(self._save(key, clip))
+            self._save_tasks.add(task)
+            task.add_done_callback(self._save_tasks.discard)
+
+    def _add(self, key: str, clip: CachedClip):
+        self.clips[key] = clip
+        self.size += clip.size
+
+        # 오래 사용하지 않은 clip 부터 메모리에서 제거 (디스크 파일은 files 에서 관리)
+        while self.size > self.max_bytes and len(self.clips) > 1:
+            _, evicted = self.clips.popitem(last=False)
+            self.size -= evicted.size
+
+    def _path(self, key: str, extension: str) -> str:
+        return os.path.join(self.directory, f"{key}.{extension}")
+
+    async def _save(self, key: str, clip: CachedClip):
+        # 파일 쓰기와 삭제는 이벤트 루프를 막지 않도록 스레드에서 처리
+        evicted = self._add_file(key, clip.size)
+        saved = await asyncio.to_thread(self._write, key, clip, evicted)
+        if saved is None:
+            self.disk_size -= self.files.pop(key, 0)
+            return
+
+        # 메모리의 복사본을 mmap 으로 교체
+        if self.clips.get(key) is clip:
+            self.clips[key] = saved
+
+    def _write(
+        self, key: str, clip: CachedClip, evicted: list[str]
+    ) -> CachedClip | None:
+        self._delete_files(evicted)
+        try:
+            with open(self._path(key, "json"), "w") as f:
+                json.dump([asdict(viseme) for viseme in clip.visemes], f)
+            with open(self._path(key, "pcm"), "wb") as f:
+                f.write(clip.pcm)
+        except OSError as e:
+            logger.warning(f"⚠️ TTS cache 저장 실패: {e}")
+            self._delete_files([key])
+            return None
+        return self._load(key)
+
+    def _scan(self):
+        # 이전 실행에서 저장한 파일을 오래된 순서로 등록 (용량을 넘으면 삭제됨)
+        entries = []
+        for name in os.listdir(self.directory):
+            key, extension = os.path.splitext(name)
+            if extension != ".pcm":
+                continue
+            stat = os.stat(os.path.join(self.directory, name))
+            entries.append((stat.st_mtime, key, stat.st_size))
+
+        for _, key, size in sorted(entries):
+            self._delete_files(self._add_file(key, size))
+
+    def _add_file(self, key: str, size: int) -> list[str]:
+        # 용량을 넘어 index 에서 빠진 key 를 반환 (파일은 호출한 쪽에서 삭제)
+        self.disk_size -= self.files.pop(key, 0)
+        self.files[key] = size
+        self.disk_size += size
+
+        evicted = []
+        while self.disk_size > self.disk_max_bytes and len(self.files) > 1:
+            evicted_key, evicted_size = self.files.popitem(last=False)
+            self.disk_size -= evicted_size
+            evicted.append(evicted_key)
+        return evicted
+
+    def _remove_file(self, key: str):
+        self.disk_size -= self.files.pop(key, 0)
+        self._delete_files([key])
+
+    def _delete_files(self, keys: list[str]):
+        # 이미 mmap 된 clip 은 파일을 지워도 계속 읽을 수 있음
+        for key in keys:
+            for extension in ("json", "pcm"):
+                try:
+                    os.remove(self._path(key, extension))
+                except OSError:
+                    pass
+
+    def _load(self, key: str) -> CachedClip | None:
+        try:
+            with open(self._path(key, "json")) as f:
+                visemes = [Viseme(**viseme) for viseme in json.load(f)]
+            with open(self._path(key, "pcm"), "rb") as f:
+                pcm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        return CachedClip(pcm=pcm, visemes=visemes)
+
+    async def warm_up(
+        self, voices: list[str], phrases: list[str], timeout: float = 30
+    ):
+        try:
+            await asyncio.wait_for(self._warm_up(voices, phrases), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"⚠️ TTS cache warm-up timed out: {self.stats}")
+            return
+        logger.info(f"🔥 TTS cache warm-up: {self.stats}")
+
+    async def _warm_up(self, voices: list[str], phrases: list[str]):
+        loop = asyncio.get_running_loop()
+        for voice in voices:
+            for text in phrases:
+                key = self.key(voice, text)
+                if key in self.clips:
+                    continue
+
+                channel = AudioChannel(loop, record=True)
+                visemes = RecordingVisemes()
+                pooled = synthesizer_pool.acquire(voice, channel, visemes)
+                try:
+                    result = await pooled.speak(text, loop)
+                except BaseException:
+                    pooled.close()
+                    raise
+                finally:
+                    channel.close()
+
+                if result.reason != speechsdk.ResultReason.SynthesizingAudioCompleted:
+                    pooled.close()
+                    logger.error(f"⚠️ TTS cache warm-up failed: {text}")
+                    continue
+
+                synthesizer_pool.release(pooled)
+                self.put(key, channel.recorded, visemes.events)
+
+    @property
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "clips": len(self.clips),
+            "bytes": self.size,
+            "disk_bytes": self.disk_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+tts_cache = TTSCache()
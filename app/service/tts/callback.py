@@ -1,23 +1,24 @@
-import asyncio
 import logging
 
 import azure.cognitiveservices.speech as speechsdk
 
 from app.audio.utils import WavFileWriter
 
+from .channel import AudioChannel
+
 logger = logging.getLogger(__name__)
 
 
 class StreamCallback(speechsdk.audio.PushAudioOutputStreamCallback):
-    def __init__(self, queue: asyncio.Queue):
+    def __init__(self, channel: AudioChannel | None):
         super().__init__()
-        self.queue = queue
-        self.loop = asyncio.get_running_loop()
+        self.channel = channel
         # self.wav = WavFileWriter(path_prefix="original")
 
     def write(self, audio_buffer: memoryview) -> int:
         chunk = audio_buffer.tobytes()
-        asyncio.run_coroutine_threadsafe(self.queue.put(chunk), self.loop)
+        if self.channel:
+            self.channel.write(chunk)
 
         # self.wav.write(chunk)
 
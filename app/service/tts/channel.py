@@ -0,0 +1,92 @@
+import asyncio
+import threading
+from collections import deque
+from time import time
+
+BYTES_PER_SECOND = 48000 * 2  # 48kHz, 16bit mono
+
+
+class AudioChannel:
+    # Azure SDK 스레드 → 이벤트 루프로 PCM 전달
+    # 쌓인 chunk 가 소비되기 전까지는 루프를 한 번만 깨움
+    def __init__(self, loop: asyncio.AbstractEventLoop, record: bool = False):
+        self._loop = loop
+        self._lock = threading.Lock()
+        self._chunks = deque()
+        self._closed = False
+        self._waiter: asyncio.Future = None
+        self._wakeup_scheduled = False
+
+        self.wakeups = 0
+        self.bytes = 0
+        self.first_write_time: float = None
+        # 캐시 저장용으로 받은 PCM 전체를 보관
+        self.recorded = bytearray() if record else None
+
+    def _schedule_wakeup(self):
+        # lock 안에서 호출
+        if self._wakeup_scheduled:
+            return False
+        self._wakeup_scheduled = True
+        return True
+
+    def write(self, chunk: bytes):
+        with self._lock:
+            if self.first_write_time is None:
+                self.first_write_time = time()
+            self._chunks.append(chunk)
+            self.bytes += len(chunk)
+            if self.recorded is not None:
+                self.recorded.extend(chunk)
+            wakeup = self._schedule_wakeup()
+
+        if wakeup:
+            self._loop.call_soon_threadsafe(self._wakeup)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            wakeup = self._schedule_wakeup()
+
+        if wakeup:
+            self._loop.call_soon_threadsafe(self._wakeup)
+
+    def _wakeup(self):
+        with self._lock:
+            self._wakeup_scheduled = False
+            waiter, self._waiter = self._waiter, None
+
+        self.wakeups += 1
+        if waiter and not waiter.done():
+            waiter.set_result(None)
+
+    async def get(self) -> bytes | None:
+        # 쌓인 chunk 를 한 번에 반환, 종료되면 None
+        while True:
+            with self._lock:
+                if self._chunks:
+                    chunk = b"".join(self._chunks)
+                    self._chunks.clear()
+                    return chunk
+                if self._closed:
+                    return None
+
+                waiter = self._loop.create_future()
+                self._waiter = waiter
+
+            await waiter
+
+    def qsize(self) -> int:
+        return len(self._chunks)
+
+    @property
+    def pending_bytes(self) -> int:
+        with self._lock:
+            return sum(len(chunk) for chunk in self._chunks)
+
+    @property
+    def wakeups_per_second(self) -> float:
+        seconds = self.bytes / BYTES_PER_SECOND
+        if not seconds:
+            return 0.0
+        return self.wakeups / seconds
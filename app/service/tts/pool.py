@@ -0,0 +1,132 @@
+import asyncio
+import logging
+from collections import defaultdict, deque
+from os import getenv
+
+import azure.cognitiveservices.speech as speechsdk
+
+from app.config import TTS_POOL_SIZE
+
+from .callback import StreamCallback
+from .channel import AudioChannel
+from .voice import SynthesisVoiceKorean
+
+logger = logging.getLogger(__name__)
+
+
+OUTPUT_FORMAT = speechsdk.SpeechSynthesisOutputFormat.Raw48Khz16BitMonoPcm
+
+
+def create_speech_config(voice: SynthesisVoiceKorean) -> speechsdk.SpeechConfig:
+    speech_config = speechsdk.SpeechConfig(
+        subscription=getenv("AZURE_SPEECH_KEY"),
+        region=getenv("AZURE_SPEECH_REGION"),
+    )
+    speech_config.speech_synthesis_voice_name = voice
+    speech_config.set_speech_synthesis_output_format(OUTPUT_FORMAT)
+    return speech_config
+
+
+def _set_result(future: asyncio.Future, result):
+    if not future.done():
+        future.set_result(result)
+
+
+class PooledSynthesizer:
+    def __init__(self, voice: SynthesisVoiceKorean):
+        self.voice = voice
+        self.on_viseme = None
+
+        # 출력 stream 과 viseme 이벤트는 lease 마다 해당 세션으로 연결
+        self.callback = StreamCallback(None)
+        audio_stream = speechsdk.audio.PushAudioOutputStream(self.callback)
+        audio_config = speechsdk.audio.AudioOutputConfig(stream=audio_stream)
+        self.synthesizer = speechsdk.SpeechSynthesizer(
+            create_speech_config(voice), audio_config
+        )
+        self.synthesizer.viseme_received.connect(self._emit_viseme)
+        self.synthesizer.synthesis_completed.connect(self._on_finished)
+        self.synthesizer.synthesis_canceled.connect(self._on_finished)
+
+        self._loop: asyncio.AbstractEventLoop = None
+        self._future: asyncio.Future = None
+        self._result_future: speechsdk.ResultFuture = None
+
+        # 서비스 연결을 미리 열어 첫 문장의 연결 지연 제거
+        self.connection = speechsdk.Connection.from_speech_synthesizer(self.synthesizer)
+        self.connection.open(True)
+
+    def _emit_viseme(self, event: speechsdk.SpeechSynthesisVisemeEventArgs):
+        on_viseme = self.on_viseme
+        if on_viseme:
+            on_viseme(event)
+
+    def speak(
+        self, text: str, loop: asyncio.AbstractEventLoop
+    ) -> asyncio.Future[speechsdk.SpeechSynthesisResult]:
+        # 완료/취소 이벤트로 결과를 전달하므로 결과를 기다리는 스레드가 필요 없음
+        self._loop = loop
+        self._future = loop.create_future()
+        self._result_future = self.synthesizer.speak_text_async(text)
+        return self._future
+
+    def _on_finished(self, event: speechsdk.SpeechSynthesisEventArgs):
+        loop, future = self._loop, self._future
+        if future is None:
+            return
+
+        self._future = None
+        self._result_future = None
+        loop.call_soon_threadsafe(_set_result, future, event.result)
+
+    def bind(self, channel: AudioChannel, on_viseme):
+        self.callback.channel = channel
+        self.on_viseme = on_viseme
+
+    def unbind(self):
+        self.callback.channel = None
+        self.on_viseme = None
+
+    def close(self):
+        self.unbind()
+        self.connection.close()
+
+
+class SynthesizerPool:
+    def __init__(self, size: int = TTS_POOL_SIZE):
+        self.size = size
+        self.idle: dict[SynthesisVoiceKorean, deque[PooledSynthesizer]] = defaultdict(
+            deque
+        )
+
+    def acquire(
+        self, voice: SynthesisVoiceKorean, channel: AudioChannel, on_viseme
+    ) -> PooledSynthesizer:
+        idle = self.idle[voice]
+        synthesizer = idle.popleft() if idle else PooledSynthesizer(voice)
+        synthesizer.bind(channel, on_viseme)
+        return synthesizer
+
+    def release(self, synthesizer: PooledSynthesizer):
+        synthesizer.unbind()
+
+        idle = self.idle[synthesizer.voice]
+        if len(idle) < self.size:
+            idle.append(synthesizer)
+        else:
+            synthesizer.close()
+
+    async def warm_up(self, voices: list[SynthesisVoiceKorean]):
+        for voice in voices:
+            idle = self.idle[voice]
+            while len(idle) < self.size:
+                idle.append(await asyncio.to_thread(PooledSynthesizer, voice))
+        logger.info(f"🔥 TTS synthesizer warm-up: {len(voices)} voices x {self.size}")
+
+    def close(self):
+        for idle in self.idle.values():
+            while idle:
+                idle.popleft().close()
+
+
+synthesizer_pool = SynthesizerPool()
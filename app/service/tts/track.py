@@ -1,19 +1,30 @@
 import asyncio
 import logging
-from array import array
-from os import getenv
+import threading
 from time import time
 from typing import AsyncIterator
 
 import azure.cognitiveservices.speech as speechsdk
 import numpy as np
 
+from app.audio.ring import PCMRingBuffer
 from app.audio.track import AudioTrack
+from app.config import TTS_MAX_AHEAD
 from app.util.time import log_time
 from app.websocket import sio as socket
 
-from .callback import StreamCallback
-from .viseme import Viseme
+from .cache import CachedClip, tts_cache
+from .channel import AudioChannel
+from .pool import synthesizer_pool
+from .viseme import (
+    RecordingVisemes,
+    ScheduledVisemes,
+    SentenceVisemes,
+    Viseme,
+    VisemeBatcher,
+    VisemeScheduler,
+    VisemeSequencer,
+)
 from .voice import SynthesisVoiceKorean
 
 logger = logging.getLogger(__name__)
@@ -26,20 +37,22 @@ class TTSAudioTrack(AudioTrack):
         self.loop = asyncio.get_running_loop()
 
         self.queues = asyncio.Queue()
-        self.current_queue: asyncio.Queue = None
-        self.buffer = array("h")
+        self.current_queue: AudioChannel = None
+        self.buffer = PCMRingBuffer()
+        self.frame = np.zeros(self.samples_per_frame, dtype=np.int16)
         self.is_pending = asyncio.Event()
         self.is_pending.set()
         self.is_first_queue = False
 
-        self.speech_config = speechsdk.SpeechConfig(
-            subscription=getenv("AZURE_SPEECH_KEY"),
-            region=getenv("AZURE_SPEECH_REGION"),
-        )
         self.voice = voice
-        self.speech_config.set_speech_synthesis_output_format(
-            speechsdk.SpeechSynthesisOutputFormat.Raw48Khz16BitMonoPcm
-        )
+        self.viseme_version = 1
+        self.viseme_batcher = VisemeBatcher(self.loop, self._emit_visemes)
+        self.viseme_scheduler = VisemeScheduler(self.sample_rate)
+
+        # 발화 시작부터 버퍼에 쓴/읽은 샘플 수
+        self.written_samples = 0
+        self.read_samples = 0
+        self.frame_position = 0
 
         self.start_time = None
 
@@ -48,13 +61,19 @@ class TTSAudioTrack(AudioTrack):
             await self.event.wait()
         pcm = await self.get_pcm(self.samples_per_frame)
         await self.sleep()
+        if self.viseme_version >= 3:
+            self.release_visemes()
         log_time(self.start_time, "TTS")
         self.start_time = None
+
+        if pcm is None:
+            return self.create_silent_frame()
         return self.create_frame(pcm)
 
     async def _handle_chunk(self, chunk: bytes):
         if chunk is not None:
-            self.buffer.frombytes(chunk)
+            self.buffer.write(chunk)
+            self.written_samples += len(chunk) // 2
             return
 
         queue = await self.queues.get()
@@ -63,73 +82,159 @@ class TTSAudioTrack(AudioTrack):
             return True
 
         self.current_queue = queue
+        self.viseme_scheduler.start(queue, self.written_samples)
         return
 
-    async def get_pcm(self, size: int) -> np.ndarray:
+    async def get_pcm(self, size: int) -> np.ndarray | None:
         while len(self.buffer) < size:
             chunk = await self.current_queue.get()
             if await self._handle_chunk(chunk):
                 break
 
-        if not self.buffer:
-            return np.zeros(size, dtype=np.int16)
+        # 재사용하는 frame 배열에 복사 (부족한 부분은 0 으로 채워짐)
+        pcm = self.frame if size == len(self.frame) else np.empty(size, dtype=np.int16)
+        self.frame_position = self.read_samples
+        read_size = self.buffer.read_into(pcm)
+        self.read_samples += read_size
+        if read_size == 0:
+            return None
+        if pcm.any():
+            return pcm
 
-        read_size = min(len(self.buffer), size)
-        view = np.frombuffer(self.buffer, dtype=np.int16)
-        pcm = view[:read_size].copy()
-        self.buffer = array("h", memoryview(self.buffer)[read_size:])
-
-        if read_size < size:
-            padded = np.zeros(size, dtype=np.int16)
-            padded[:read_size] = pcm
-            return padded
-
-        qsize = self.current_queue.qsize()
-        if np.all(pcm == 0) and qsize < 8:
+        # 합성 결과 앞뒤의 무음은 건너뛰고, 남은 무음은 공유 무음 프레임으로 보냄 (DTX 대상)
+        if read_size == size and self.current_queue.qsize() < 8:
             return await self.get_pcm(size)
+        return None
 
-        return pcm
-
-    async def run_synthesis(self, response: AsyncIterator[str]):
-        self.current_queue = asyncio.Queue()
+    async def run_synthesis(
+        self, response: AsyncIterator[str], cache_audio: bool = False
+    ):
+        self.current_queue = AudioChannel(self.loop)
         self.is_first_queue = True
         await self.reset_audio()
         self.is_pending.clear()
 
+        self.written_samples = 0
+        self.read_samples = 0
+        self.viseme_scheduler.reset()
+        self.viseme_scheduler.start(self.current_queue, 0)
+
+        channels: list[AudioChannel] = []
+        tasks = set()
+        visemes = VisemeSequencer(self.emit_viseme)
+
         self.start_time = True
-        async for chunk in response:
-            if self.start_time:
-                self.start_time = time()
-            await self._run_synthesis_once(chunk)
+        try:
+            async for chunk in response:
+                if self.start_time:
+                    self.start_time = time()
+
+                while len(tasks) >= self._synthesis_ahead(channels):
+                    done, tasks = await asyncio.wait(
+                        tasks, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        if task.exception():
+                            logger.error(f"⚠️ TTS Error: {task.exception()}")
+
+                # 재생 순서는 queues 에 등록되는 순서로 유지
+                queue = await self._get_queue()
+                channels.append(queue)
+                if self.viseme_version >= 3:
+                    sentence = self.viseme_scheduler.add_sentence(queue)
+                else:
+                    sentence = visemes.add_sentence()
+                task = asyncio.create_task(
+                    self._run_synthesis_once(chunk, queue, sentence, cache_audio)
+                )
+                tasks.add(task)
+
+            for result in await asyncio.gather(*tasks, return_exceptions=True):
+                if isinstance(result, Exception):
+                    logger.error(f"⚠️ TTS Error: {result}")
+        finally:
+            # 취소되면 (barge-in 등) 남은 합성도 함께 중단
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
         await self.queues.put(None)
         await self.is_pending.wait()
 
+    def _synthesis_ahead(self, channels: list[AudioChannel]) -> int:
+        # 재생 대기 중인 오디오가 적을수록 더 많은 문장을 동시에 합성
+        samples = len(self.buffer) + sum(c.pending_bytes for c in channels) // 2
+        buffered = samples / self.sample_rate
+        if buffered < 1:
+            return TTS_MAX_AHEAD
+        if buffered < 3:
+            return max(1, TTS_MAX_AHEAD - 1)
+        return 1
+
     async def _get_queue(self):
         if self.is_first_queue:
             self.is_first_queue = False
             return self.current_queue
-        queue = asyncio.Queue()
+        queue = AudioChannel(self.loop)
         await self.queues.put(queue)
         return queue
 
-    async def _run_synthesis_once(self, text: str):
-        queue = await self._get_queue()
-        self.stream_callback = StreamCallback(queue)
+    async def _run_synthesis_once(
+        self,
+        text: str,
+        queue: AudioChannel,
+        visemes: SentenceVisemes | ScheduledVisemes,
+        cache_audio: bool = False,
+    ):
+        cache_key = None
+        if cache_audio or tts_cache.cacheable(text):
+            cache_key = tts_cache.key(self.voice, text)
+            clip = tts_cache.get(cache_key)
+            if clip:
+                self._play_cached(clip, queue, visemes)
+                return
 
-        audio_stream = speechsdk.audio.PushAudioOutputStream(self.stream_callback)
-        audio_config = speechsdk.audio.AudioOutputConfig(stream=audio_stream)
-        synthesizer = speechsdk.SpeechSynthesizer(self.speech_config, audio_config)
-        synthesizer.viseme_received.connect(self.emit_viseme)
-        future = synthesizer.speak_text_async(text)
-        result = await asyncio.to_thread(future.get)
-        await queue.put(None)
+        # 고정 문구이거나 반복된 짧은 문장만 녹음해서 캐시에 저장
+        if cache_key and (cache_audio or tts_cache.admit(cache_key)):
+            queue.recorded = bytearray()
+            visemes = RecordingVisemes(visemes)
+        else:
+            cache_key = None
+
+        pooled = synthesizer_pool.acquire(self.voice, queue, visemes)
+
+        start_time = time()
+        try:
+            result = await pooled.speak(text, self.loop)
+        except BaseException:
+            # 취소(barge-in) 시에도 닫아서 이 세션의 queue/viseme 로 계속 쓰지 않게 함
+            pooled.close()
+            visemes.finish()
+            raise
+        finally:
+            queue.close()
+
+        if queue.first_write_time:
+            ttfb = (queue.first_write_time - start_time) * 1000
+            logger.debug(f"⏰ TTS first byte: {ttfb:.2f}ms")
+        logger.debug(
+            f"🔔 TTS wakeups: {queue.wakeups_per_second:.1f}/s of audio, "
+            f"threads: {threading.active_count()}"
+        )
 
         if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
             # logger.debug("Speech synthesized for text [{}]".format(text))
-            self.emit_viseme(Viseme(animation="", audio_offset=0, viseme_id=-1))
+            synthesizer_pool.release(pooled)
+            if cache_key:
+                tts_cache.put(cache_key, queue.recorded, visemes.events)
+            visemes(Viseme(animation="", audio_offset=0, viseme_id=-1))
+            visemes.finish()
             return
 
+        # 오류가 난 synthesizer 는 pool 에 돌려놓지 않음
+        pooled.close()
+        visemes.finish()
+
         if result.reason == speechsdk.ResultReason.Canceled:
             cancellation_details = result.cancellation_details
             logger.info(
@@ -141,7 +246,45 @@ class TTSAudioTrack(AudioTrack):
                         "Error details: {}".format(cancellation_details.error_details)
                     )
 
+    def _play_cached(
+        self,
+        clip: CachedClip,
+        queue: AudioChannel,
+        visemes: SentenceVisemes | ScheduledVisemes,
+    ):
+        queue.write(bytes(clip.pcm))
+        queue.close()
+
+        for viseme in clip.visemes:
+            visemes(viseme)
+        visemes(Viseme(animation="", audio_offset=0, viseme_id=-1))
+        visemes.finish()
+        logger.debug(f"💾 TTS cache hit: {tts_cache.stats}")
+
+    def release_visemes(self):
+        released = self.viseme_scheduler.release(self.frame_position)
+        if not released:
+            return
+
+        # 현재 프레임의 pts 를 기준으로 RTP timeline 으로 변환
+        frame_pts = self._timestamp + self.offset
+        visemes = {
+            "timestamp": [
+                frame_pts + position - self.frame_position for position, _ in released
+            ],
+            "viseme_id": [event.viseme_id for _, event in released],
+            "audio_offset": [event.audio_offset / 10000 for _, event in released],
+        }
+        asyncio.create_task(self._emit_visemes(visemes))
+
+    async def _emit_visemes(self, visemes: dict):
+        await socket.emit("visemes", visemes, to=self.sid)
+
     def emit_viseme(self, event: speechsdk.SpeechSynthesisVisemeEventArgs):
+        if self.viseme_version >= 2:
+            self.viseme_batcher.add(event)
+            return
+
         asyncio.run_coroutine_threadsafe(
             socket.emit(
                 "viseme",
@@ -156,9 +299,9 @@ class TTSAudioTrack(AudioTrack):
         )
 
     @property
-    def voice(self):
-        return self.speech_config.speech_synthesis_voice_name
+    def voice(self) -> SynthesisVoiceKorean:
+        return self._voice
 
     @voice.setter
     def voice(self, voice: SynthesisVoiceKorean):
-        self.speech_config.speech_synthesis_voice_name = voice
+        self._voice = voice
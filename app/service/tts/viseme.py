@@ -1,7 +1,187 @@
+import asyncio
+import heapq
+import threading
+from collections import deque
 from dataclasses import dataclass
 
+# 1: viseme 마다 "viseme" 이벤트, 2: 묶어서 "visemes" 이벤트
+# 3: 오디오 재생 시점에 맞춰 RTP timestamp 와 함께 "visemes" 이벤트
+VISEME_PROTOCOL_VERSION = 3
+VISEME_FLUSH_INTERVAL = 0.05  # 50ms
+VISEME_LOOKAHEAD = 0.1  # 재생 100ms 전에 전송
+
 @dataclass
 class Viseme:
     animation: str
     audio_offset: int
-    viseme_id: int
\ No newline at end of file
+    viseme_id: int
+
+
+class RecordingVisemes:
+    # 캐시에 저장하기 위해 viseme 를 복사해 두고 그대로 전달
+    def __init__(self, visemes=None):
+        self.visemes = visemes
+        self.events: list[Viseme] = []
+
+    def __call__(self, event):
+        self.events.append(Viseme(event.animation, event.audio_offset, event.viseme_id))
+        if self.visemes:
+            self.visemes(event)
+
+    def finish(self):
+        if self.visemes:
+            self.visemes.finish()
+
+
+class VisemeSequencer:
+    # 동시에 합성되는 문장들의 viseme 를 문장 순서대로 내보냄
+    def __init__(self, emit):
+        self.emit = emit
+        self.sentences: deque[SentenceVisemes] = deque()
+        self.lock = threading.Lock()
+
+    def add_sentence(self) -> "SentenceVisemes":
+        sentence = SentenceVisemes(self)
+        with self.lock:
+            self.sentences.append(sentence)
+        return sentence
+
+
+class SentenceVisemes:
+    def __init__(self, sequencer: VisemeSequencer):
+        self.sequencer = sequencer
+        self.events = []
+        self.done = False
+
+    def __call__(self, event):
+        sequencer = self.sequencer
+        with sequencer.lock:
+            if sequencer.sentences[0] is self:
+                sequencer.emit(event)
+            else:
+                self.events.append(event)
+
+    def finish(self):
+        sequencer = self.sequencer
+        with sequencer.lock:
+            self.done = True
+            sentences = sequencer.sentences
+            while sentences and sentences[0].done:
+                sentences.popleft()
+                if not sentences:
+                    break
+
+                # 다음 문장이 재생 순서의 맨 앞이 되면 모아둔 viseme 전송
+                head = sentences[0]
+                for event in head.events:
+                    sequencer.emit(event)
+                head.events.clear()
+
+
+class VisemeBatcher:
+    # SDK 스레드에서 받은 viseme 를 모아 짧은 주기로 한 번에 전송
+    def __init__(self, loop: asyncio.AbstractEventLoop, emit):
+        self.loop = loop
+        self.emit = emit
+        self.lock = threading.Lock()
+        self.offsets = []
+        self.ids = []
+        self.animations = []
+        self.scheduled = False
+
+    def add(self, event):
+        with self.lock:
+            self.offsets.append(event.audio_offset / 10000)
+            self.ids.append(event.viseme_id)
+            self.animations.append(event.animation)
+
+            # 문장 끝(-1)은 바로 전송, 그 외에는 배치의 첫 viseme 에서만 루프를 깨움
+            if event.viseme_id == -1:
+                self.loop.call_soon_threadsafe(self.flush)
+                return
+            if self.scheduled:
+                return
+            self.scheduled = True
+
+        self.loop.call_soon_threadsafe(
+            self.loop.call_later, VISEME_FLUSH_INTERVAL, self.flush
+        )
+
+    def flush(self):
+        with self.lock:
+            self.scheduled = False
+            if not self.ids:
+                return
+
+            payload = {"audio_offset": self.offsets, "viseme_id": self.ids}
+            if any(self.animations):
+                payload["animation"] = self.animations
+            self.offsets, self.ids, self.animations = [], [], []
+
+        asyncio.create_task(self.emit(payload))
+
+
+class VisemeScheduler:
+    # 문장별 audio_offset 을 트랙의 재생 위치(샘플)로 변환해 재생 직전에 내보냄
+    def __init__(self, sample_rate: int = 48000, lookahead: float = VISEME_LOOKAHEAD):
+        self.sample_rate = sample_rate
+        self.lookahead = int(sample_rate * lookahead)
+        self.lock = threading.Lock()
+        self.starts = {}
+        self.pending = {}
+        self.timeline = []
+        self.sequence = 0
+
+    def add_sentence(self, channel) -> "ScheduledVisemes":
+        return ScheduledVisemes(self, channel)
+
+    def add(self, channel, event):
+        if event.viseme_id == -1:
+            # 문장 끝 표시는 문장 오디오의 마지막 위치에 배치
+            offset = channel.bytes // 2
+        else:
+            offset = round(event.audio_offset / 10_000_000 * self.sample_rate)
+
+        with self.lock:
+            start = self.starts.get(channel)
+            if start is None:
+                self.pending.setdefault(channel, []).append((offset, event))
+            else:
+                self._push(start + offset, event)
+
+    def _push(self, position: int, event):
+        heapq.heappush(self.timeline, (position, self.sequence, event))
+        self.sequence += 1
+
+    def start(self, channel, position: int):
+        # 문장의 첫 샘플이 버퍼에 들어가는 위치가 정해지면 호출
+        with self.lock:
+            self.starts[channel] = position
+            for offset, event in self.pending.pop(channel, []):
+                self._push(position + offset, event)
+
+    def release(self, position: int) -> list[tuple[int, object]]:
+        released = []
+        with self.lock:
+            while self.timeline and self.timeline[0][0] < position + self.lookahead:
+                event_position, _, event = heapq.heappop(self.timeline)
+                released.append((event_position, event))
+        return released
+
+    def reset(self):
+        with self.lock:
+            self.starts.clear()
+            self.pending.clear()
+            self.timeline.clear()
+
+
+class ScheduledVisemes:
+    def __init__(self, scheduler: VisemeScheduler, channel):
+        self.scheduler = scheduler
+        self.channel = channel
+
+    def __call__(self, event):
+        self.scheduler.add(self.channel, event)
+
+    def finish(self):
+        pass
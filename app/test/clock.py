@@ -0,0 +1,96 @@
+import asyncio
+import sys
+from time import process_time, time
+
+import numpy as np
+
+from app.audio.clock import ClockStats, MediaClock
+from app.audio.ring import PCMRingBuffer
+
+# python -m app.test.clock 500
+# 턴이 끝난 TTSAudioTrack 은 event.wait() 에서 멈춰 pacing 하지 않으므로,
+# 두 시나리오 모두 턴 진행 중에 20ms 마다 프레임을 보내는 트랙을 측정함
+TRACKS = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+SECONDS = 5
+SAMPLE_RATE = 48000
+FRAME_SAMPLES = 960
+
+
+class SilentTrack:
+    # 턴 중 무음 구간 (합성 대기, 문장 사이): 공유 무음 프레임만 보냄
+    def frame(self):
+        pass
+
+
+class SpeakingTrack:
+    # 발화 중: 합성된 PCM 을 ring buffer 에 쓰고 프레임 단위로 읽음
+    def __init__(self):
+        self.buffer = PCMRingBuffer()
+        self.chunk = np.random.randint(-3000, 3000, FRAME_SAMPLES, np.int16).tobytes()
+        self.pcm = np.zeros(FRAME_SAMPLES, dtype=np.int16)
+
+    def frame(self):
+        self.buffer.write(self.chunk)
+        self.buffer.read_into(self.pcm)
+        self.pcm.any()
+
+
+class PacedTrack:
+    # AudioTrack.recv/sleep 과 같은 방식으로 _timestamp 기준 deadline 까지 대기
+    def __init__(self, source, clock: MediaClock | None):
+        self.source = source
+        self.clock = clock
+        self.stats = ClockStats()
+        self.audio_start = None
+        self.timestamp = 0
+
+    async def sleep(self):
+        if self.audio_start is None:
+            now = time()
+            self.audio_start = self.clock.align(now) if self.clock else now
+            return
+
+        self.timestamp += FRAME_SAMPLES
+        deadline = self.audio_start + self.timestamp / SAMPLE_RATE
+        if self.clock:
+            await self.clock.wait_until(deadline, self.stats)
+            return
+
+        # 기존 AudioTrack.sleep 방식: 트랙마다 asyncio.sleep
+        wait = deadline - time()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        self.stats.record(time() - deadline)
+
+    async def run(self, end: float):
+        while time() < end:
+            self.source.frame()
+            await self.sleep()
+
+
+async def bench(name, clock, source_class):
+    tracks = [PacedTrack(source_class(), clock) for _ in range(TRACKS)]
+    end = time() + SECONDS
+    cpu = process_time()
+    await asyncio.gather(*(track.run(end) for track in tracks))
+    cpu = process_time() - cpu
+
+    stats = [track.stats for track in tracks]
+    frames = sum(s.frames for s in stats) / TRACKS
+    jitter = sum(s.jitter for s in stats) / TRACKS * 1000
+    max_jitter = max(s.max_jitter for s in stats) * 1000
+    print(
+        f"{name} ({TRACKS} {source_class.__name__}): "
+        f"CPU {cpu / SECONDS * 100:.1f}%, {frames:.0f} frames/track, "
+        f"mean jitter {jitter:.2f}ms, max jitter {max_jitter:.2f}ms"
+    )
+
+
+async def main():
+    clock = MediaClock()
+    for source_class in (SilentTrack, SpeakingTrack):
+        await bench("asyncio.sleep", None, source_class)
+        await bench("MediaClock", clock, source_class)
+
+
+asyncio.run(main())
@@ -0,0 +1,49 @@
+import tracemalloc
+from time import perf_counter
+
+import numpy as np
+
+from app.audio.resample import (
+    MonoDownmixer,
+    StreamingResampler,
+    resample_to_16k,
+    resample_to_mono,
+)
+
+FRAMES = 2000
+
+pcm = (np.random.randn(960 * 2) * 3000).astype(np.int16).tobytes()
+downmixer = MonoDownmixer()
+resampler = StreamingResampler(down=3)
+
+
+def legacy():
+    mono = resample_to_mono(memoryview(pcm), np.float32)
+    return resample_to_16k(mono)
+
+
+def fused():
+    mono = downmixer.process(memoryview(pcm))
+    return resampler.process(mono)
+
+
+def bench(fn):
+    fn()
+
+    # 프레임 1개 처리 중 임시로 할당되는 메모리 (tobytes 결과 포함)
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = perf_counter()
+    for _ in range(FRAMES):
+        fn()
+    elapsed = perf_counter() - start
+
+    print(f"{fn.__name__}: {elapsed / FRAMES * 1e6:.1f}us/frame, peak {peak}B/frame")
+
+
+bench(legacy)
+bench(fused)
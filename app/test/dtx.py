@@ -0,0 +1,66 @@
+import asyncio
+
+import numpy as np
+from aiortc.codecs import get_encoder
+from aiortc.rtcrtpparameters import RTCRtpCodecParameters
+
+from app.audio.dtx import DTXEncoder
+from app.service.tts.channel import AudioChannel
+from app.service.tts.track import TTSAudioTrack
+from app.service.tts.voice import SynthesisVoiceKorean
+
+# python -m app.test.dtx
+# 앞뒤와 중간에 무음이 있는 합성 결과로 TTS 턴 하나를 재생하고 생략된 패킷 수를 셈
+
+SAMPLE_RATE = 48000
+CHUNK_SAMPLES = 4800  # Azure 가 보내는 것처럼 100ms 단위로 전달
+OPUS = RTCRtpCodecParameters(mimeType="audio/opus", clockRate=48000, channels=2)
+
+
+def silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(SAMPLE_RATE * seconds), dtype=np.int16)
+
+
+def tone(seconds: float) -> np.ndarray:
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    return (np.sin(2 * np.pi * 220 * t) * 3000).astype(np.int16)
+
+
+async def main():
+    loop = asyncio.get_running_loop()
+    track = TTSAudioTrack("dtx-test", SynthesisVoiceKorean.InJoon)
+    encoder = DTXEncoder(get_encoder(OPUS))
+
+    # 앞 무음 300ms, 발화 1s, 쉼 500ms, 발화 1s, 뒤 무음 600ms
+    pcm = np.concatenate(
+        [silence(0.3), tone(1), silence(0.5), tone(1), silence(0.6)]
+    ).tobytes()
+    channel = AudioChannel(loop)
+    for start in range(0, len(pcm), CHUNK_SAMPLES * 2):
+        channel.write(pcm[start : start + CHUNK_SAMPLES * 2])
+    channel.close()
+
+    # TTSAudioTrack.run_synthesis 와 같이 queue 를 연결하고 턴 끝을 표시
+    track.current_queue = channel
+    track.is_pending.clear()
+    await track.queues.put(None)
+
+    frames = suppressed = encoded_bytes = 0
+    while not track.is_pending.is_set():
+        frame = await track.recv()
+        payloads, _ = encoder.encode(frame)
+        frames += 1
+        if payloads:
+            encoded_bytes += sum(len(payload) for payload in payloads)
+        else:
+            suppressed += 1
+
+    assert suppressed > 0, "no packets suppressed during the TTS turn"
+    print(
+        f"✅ DTX: {suppressed}/{frames} packets suppressed, "
+        f"{encoded_bytes} bytes encoded"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
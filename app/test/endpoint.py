@@ -0,0 +1,58 @@
+import sys
+import wave
+
+import webrtcvad
+
+from app.audio.endpoint import (
+    FRAME_TIME,
+    AdaptiveEndpointer,
+    Endpointer,
+    FixedEndpointer,
+)
+
+# 16kHz mono wav 를 20ms 단위로 재생하며 발화 종료 시점을 비교
+# python -m app.test.endpoint .recordings/sample.wav
+FRAME_BYTES = 16 * 2 * FRAME_TIME
+
+
+def read_frames(path: str):
+    with wave.open(path, "rb") as wav:
+        assert wav.getframerate() == 16000 and wav.getnchannels() == 1
+        pcm = wav.readframes(wav.getnframes())
+    return [
+        pcm[i : i + FRAME_BYTES]
+        for i in range(0, len(pcm) - FRAME_BYTES + 1, FRAME_BYTES)
+    ]
+
+
+def replay(frames, endpointer: Endpointer):
+    vad = webrtcvad.Vad(3)
+    in_speech = False
+    last_voiced = 0
+    turns = []
+
+    for index, frame in enumerate(frames):
+        is_speech = vad.is_speech(frame, 16000)
+        if is_speech:
+            in_speech = True
+            last_voiced = index
+            endpointer.update(True)
+            continue
+
+        if in_speech and endpointer.update(False):
+            # 마지막 음성 프레임부터 epFlag 전송까지 걸리는 시간
+            hangover = (index - last_voiced) * FRAME_TIME
+            trailing = endpointer.trailing_silence_ms * endpointer.trailing_silence_chunks
+            turns.append(hangover + trailing)
+            endpointer.reset()
+            in_speech = False
+
+    return turns
+
+
+frames = read_frames(sys.argv[1])
+for endpointer in (FixedEndpointer(), AdaptiveEndpointer()):
+    turns = replay(frames, endpointer)
+    average = sum(turns) / len(turns) if turns else 0
+    name = type(endpointer).__name__
+    print(f"{name}: {len(turns)} turns, average dead time {average:.0f}ms")
@@ -0,0 +1,31 @@
+import asyncio
+from time import perf_counter
+
+from app.service.chat import Groq, llm_clients
+
+# 공유 LLM client 의 연결 재사용 확인
+# python -m app.test.llm_server 실행 후 GROQ_BASE_URL=http://localhost:8001/v1 로 실행
+SESSIONS = 50
+TURNS = 4
+
+
+async def session(index: int):
+    groq = Groq()
+    for turn in range(TURNS):
+        async for _ in groq.send_message_stream(f"{index}번 세션의 {turn}번째 질문입니다."):
+            pass
+
+
+async def main():
+    start = perf_counter()
+    await asyncio.gather(*(session(i) for i in range(SESSIONS)))
+    elapsed = perf_counter() - start
+
+    print(f"{SESSIONS} sessions x {TURNS} turns: {elapsed:.2f}s")
+    print(f"HTTP: {llm_clients.openai_stats}")
+    print(f"prefix cache: {Groq.prefix_cache_stats}")
+    await llm_clients.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
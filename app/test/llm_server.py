@@ -0,0 +1,87 @@
+import asyncio
+import hashlib
+import json
+import logging
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+from app.service.chat.token import estimate_tokens
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 로컬 fake OpenAI 호환 LLM (자동 prefix caching 흉내)
+# GROQ_BASE_URL=http://localhost:8001/v1 로 서버를 실행해 연결
+PORT = 8001
+BASE_LATENCY = 0.05  # seconds
+PREFILL_PER_TOKEN = 0.0002  # 캐시되지 않은 prompt 토큰당 지연
+ANSWER = "안녕하세요. 로컬 테스트 응답입니다. 무엇을 도와드릴까요?"
+
+app = FastAPI()
+prefixes: set[str] = set()
+
+
+def prefix_hashes(messages: list[dict]) -> list[str]:
+    digest = hashlib.sha256()
+    hashes = []
+    for message in messages:
+        digest.update(json.dumps(message, ensure_ascii=False).encode())
+        hashes.append(digest.hexdigest())
+    return hashes
+
+
+def cached_tokens(messages: list[dict]) -> tuple[int, int]:
+    tokens = [estimate_tokens(message["content"]) for message in messages]
+    hashes = prefix_hashes(messages)
+
+    cached = 0
+    for i, hash in enumerate(hashes):
+        if hash in prefixes:
+            cached = sum(tokens[: i + 1])
+    prefixes.update(hashes)
+    return sum(tokens), cached
+
+
+def chunk(body: dict, delta: dict | None = None, usage: dict | None = None) -> str:
+    data = {
+        "id": "fake",
+        "object": "chat.completion.chunk",
+        "created": 0,
+        "model": body["model"],
+        "choices": [{"index": 0, "delta": delta, "finish_reason": None}]
+        if delta is not None
+        else [],
+        "usage": usage,
+    }
+    return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@app.post("/v1/chat/completions")
+async def completions(request: Request):
+    body = await request.json()
+    prompt_tokens, cached = cached_tokens(body["messages"])
+    logger.info(f"prompt {prompt_tokens} tokens, cached {cached}")
+
+    async def stream():
+        await asyncio.sleep(BASE_LATENCY + (prompt_tokens - cached) * PREFILL_PER_TOKEN)
+        for i in range(0, len(ANSWER), 3):
+            yield chunk(body, {"role": "assistant", "content": ANSWER[i : i + 3]})
+            await asyncio.sleep(0.01)
+
+        if body.get("stream_options", {}).get("include_usage"):
+            usage = {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": estimate_tokens(ANSWER),
+                "total_tokens": prompt_tokens + estimate_tokens(ANSWER),
+                "prompt_tokens_details": {"cached_tokens": cached},
+            }
+            yield chunk(body, usage=usage)
+        yield "data: [DONE]\n\n"
+
+    return StreamingResponse(stream(), media_type="text/event-stream")
+
+
+if __name__ == "__main__":
+    uvicorn.run(app, port=PORT)
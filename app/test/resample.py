@@ -0,0 +1,44 @@
+from time import perf_counter
+
+import numpy as np
+
+from app.audio.resample import StreamingResampler, resample_poly, resample_to_16k
+
+FRAME = 960  # 20ms @ 48kHz
+SECONDS = 10
+
+
+def make_signal():
+    t = np.arange(48000 * SECONDS) / 48000
+    tones = [(8000, 440), (3000, 3000), (2000, 12000)]  # 12kHz 는 걸러져야 함
+    signal = sum(amp * np.sin(2 * np.pi * freq * t) for amp, freq in tones)
+    return signal.astype(np.float32)
+
+
+def bench(name, fn, frames):
+    start = perf_counter()
+    output = b"".join(fn(frame) for frame in frames)
+    elapsed = perf_counter() - start
+    print(f"{name}: {elapsed / len(frames) * 1e6:.1f}us/frame")
+    return np.frombuffer(output, dtype=np.int16).astype(np.float64)
+
+
+def report_accuracy(name, output, reference, delay=0):
+    output = output[delay:]
+    error = output - reference[: len(output)]
+    snr = 10 * np.log10(np.sum(reference**2) / np.sum(error**2))
+    spectrum = np.abs(np.fft.rfft(output))
+    alias = spectrum[int(len(output) * 4000 / 16000)]  # 12kHz 가 4kHz 로 접히는 위치
+    print(f"{name}: SNR {snr:.1f}dB, 4kHz alias {alias:.1f}")
+
+
+signal = make_signal()
+frames = [signal[i : i + FRAME] for i in range(0, len(signal), FRAME)]
+reference = resample_poly(signal, up=1, down=3)
+
+per_chunk = bench("resample_to_16k", resample_to_16k, frames)
+resampler = StreamingResampler(down=3)
+streaming = bench("StreamingResampler", resampler.process, frames)
+
+report_accuracy("resample_to_16k", per_chunk, reference)
+report_accuracy("StreamingResampler", streaming, reference, delay=len(resampler._taps) // 6)
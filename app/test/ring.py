@@ -0,0 +1,39 @@
+from array import array
+from time import perf_counter
+
+import numpy as np
+
+from app.audio.ring import PCMRingBuffer
+
+FRAME = 960
+SECONDS = 30
+
+pcm = (np.random.randn(48000 * SECONDS) * 1000).astype(np.int16).tobytes()
+frames = len(pcm) // 2 // FRAME
+
+
+def legacy():
+    # 기존 TTSAudioTrack.get_pcm 방식: 매 프레임 남은 버퍼 전체를 복사
+    buffer = array("h")
+    buffer.frombytes(pcm)
+    for _ in range(frames):
+        view = np.frombuffer(buffer, dtype=np.int16)
+        frame = view[:FRAME].copy()
+        buffer = array("h", memoryview(buffer)[FRAME:])
+    return frame
+
+
+def ring():
+    buffer = PCMRingBuffer()
+    buffer.write(pcm)
+    frame = np.zeros(FRAME, dtype=np.int16)
+    for _ in range(frames):
+        buffer.read_into(frame)
+    return frame
+
+
+for fn in (legacy, ring):
+    start = perf_counter()
+    fn()
+    elapsed = perf_counter() - start
+    print(f"{fn.__name__}: {elapsed / frames * 1e6:.1f}us/frame ({SECONDS}s response)")
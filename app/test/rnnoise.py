@@ -0,0 +1,38 @@
+import ctypes
+from time import perf_counter
+
+import numpy as np
+
+from app.rnnoise import RNNoise
+from app.rnnoise.service import FRAME_SIZE
+
+FRAMES = 5000
+TIME = 2
+
+
+def legacy_process(rnnoise: RNNoise, input: np.ndarray, time=TIME):
+    # 기존 방식: 프레임마다 np.empty + data_as 변환
+    output = np.empty(FRAME_SIZE * time, dtype=np.float32)
+    for i in range(time):
+        offset = i * FRAME_SIZE
+        frame_in = input[offset : offset + FRAME_SIZE]
+        frame_out = output[offset : offset + FRAME_SIZE]
+        ptr_in = frame_in.ctypes.data_as(ctypes.POINTER(ctypes.c_float))
+        ptr_out = frame_out.ctypes.data_as(ctypes.POINTER(ctypes.c_float))
+        rnnoise._lib.rnnoise_process_frame(rnnoise._state, ptr_out, ptr_in)
+    return output
+
+
+def bench(name, fn):
+    frame = (np.random.randn(FRAME_SIZE * TIME) * 1000).astype(np.float32)
+    start = perf_counter()
+    for _ in range(FRAMES):
+        fn(frame)
+    elapsed = perf_counter() - start
+    print(f"{name}: {FRAMES / elapsed:.0f} frames/sec ({elapsed / FRAMES * 1e6:.1f}us/frame)")
+
+
+rnnoise = RNNoise()
+print(f"batch shim: {'loaded' if rnnoise._batch_lib else 'not loaded'}")
+bench("legacy", lambda frame: legacy_process(rnnoise, frame))
+bench("current", rnnoise.process)
@@ -0,0 +1,51 @@
+import re
+from time import perf_counter
+
+from app.service.chat.segment import SentenceSegmenter
+
+LAST_PUNCTUATION_PATTERN = re.compile(r"[.?!](?!.*[.?!])\s*")
+
+# 문장 부호가 거의 없는 긴 응답 / 일반적인 응답을 3글자 토큰으로 스트리밍
+LONG = "그래서 우리는 한참을 걸었고 바람이 불었고 " * 1000
+NORMAL = "안녕하세요... 오늘 날씨는 3.5도입니다! 정말 춥죠? \"조심하세요.\" " * 100
+TOKEN = 3
+
+
+def tokens(text: str):
+    return [text[i : i + TOKEN] for i in range(0, len(text), TOKEN)]
+
+
+def legacy(chunks):
+    # 기존 ChatService 방식: 매 토큰 전체 버퍼를 정규식으로 다시 검색
+    buffer = ""
+    segments = []
+    for chunk in chunks:
+        buffer += chunk
+        match = LAST_PUNCTUATION_PATTERN.search(buffer)
+        if match:
+            segments.append(buffer[: match.end()])
+            buffer = buffer[match.end() :]
+    return segments
+
+
+def incremental(chunks):
+    segmenter = SentenceSegmenter()
+    segments = []
+    for chunk in chunks:
+        segments.extend(segmenter.feed(chunk))
+    segments.append(segmenter.flush())
+    return segments
+
+
+for name, text in (("long", LONG), ("normal", NORMAL)):
+    chunks = tokens(text)
+    for fn in (legacy, incremental):
+        start = perf_counter()
+        segments = fn(chunks)
+        elapsed = perf_counter() - start
+        print(
+            f"{name} {fn.__name__}: {elapsed * 1000:.2f}ms "
+            f"({len(text)} chars, {len(segments)} segments)"
+        )
+
+print(incremental(tokens(NORMAL[:60])))
@@ -0,0 +1,46 @@
+import asyncio
+import json
+import logging
+
+import grpc.aio
+
+from app.service.stt import nest_pb2, nest_pb2_grpc
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# 로컬 fake Clova NestService
+# STT_TARGET=localhost:50051 STT_INSECURE=true 로 서버를 실행해 연결
+PORT = 50051
+
+
+class FakeNestService(nest_pb2_grpc.NestServiceServicer):
+    async def recognize(self, request_iterator, context):
+        received = 0
+        async for request in request_iterator:
+            if request.type == nest_pb2.RequestType.CONFIG:
+                logger.info(f"config: {request.config.config}")
+                continue
+
+            received += len(request.data.chunk)
+            extra = json.loads(request.data.extra_contents)
+            if extra["epFlag"]:
+                break
+
+        text = f"{received} bytes 수신."
+        yield nest_pb2.NestResponse(
+            contents=json.dumps({"transcription": {"text": text}}, ensure_ascii=False)
+        )
+
+
+async def serve():
+    server = grpc.aio.server()
+    nest_pb2_grpc.add_NestServiceServicer_to_server(FakeNestService(), server)
+    server.add_insecure_port(f"[::]:{PORT}")
+    await server.start()
+    logger.info(f"🎧 Fake NestService listening on {PORT}")
+    await server.wait_for_termination()
+
+
+if __name__ == "__main__":
+    asyncio.run(serve())
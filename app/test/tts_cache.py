@@ -0,0 +1,53 @@
+import asyncio
+
+from app.service.tts.cache import TTSCache
+from app.service.tts.channel import AudioChannel
+from app.service.tts.track import TTSAudioTrack
+from app.service.tts.viseme import RecordingVisemes, Viseme
+
+# 메모리 모드 캐시 hit 를 재생했을 때 문장 끝 marker(-1) 가 한 번만 나오는지 확인
+
+END = Viseme(animation="", audio_offset=0, viseme_id=-1)
+
+
+class Collector:
+    def __init__(self):
+        self.events: list[Viseme] = []
+
+    def __call__(self, event):
+        self.events.append(event)
+
+    def finish(self):
+        pass
+
+
+async def main():
+    loop = asyncio.get_running_loop()
+    cache = TTSCache(directory=None)
+    key = cache.key("voice", "안녕하세요.")
+
+    # TTSAudioTrack._run_synthesis_once 와 같은 순서로 저장 후 끝 marker 전달
+    visemes = RecordingVisemes(Collector())
+    for viseme_id in (1, 2, 3):
+        visemes(Viseme(animation="", audio_offset=viseme_id, viseme_id=viseme_id))
+    cache.put(key, bytes(960 * 2), visemes.events)
+    visemes(END)
+    visemes.finish()
+
+    replayed = Collector()
+    TTSAudioTrack._play_cached(None, cache.get(key), AudioChannel(loop), replayed)
+
+    markers = [event for event in replayed.events if event.viseme_id == -1]
+    assert len(markers) == 1, f"end markers: {len(markers)}"
+    assert replayed.events[-1].viseme_id == -1
+    print(f"✅ cache replay: {len(replayed.events)} visemes, 1 end marker")
+
+    # 한 번만 나온 문장은 저장하지 않고, 반복되면 저장
+    other = cache.key("voice", "네, 알겠습니다.")
+    assert not cache.admit(other, repeats=2)
+    assert cache.admit(other, repeats=2)
+    print("✅ cache admission: stored on repeat")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
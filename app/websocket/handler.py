@@ -7,7 +7,7 @@ from socketio import AsyncServer
 
 from app.connection.session import SessionManager
 from app.service.chat import ModelList, Model
-from app.service.tts import SynthesisVoiceKorean
+from app.service.tts import VISEME_PROTOCOL_VERSION, SynthesisVoiceKorean
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +74,29 @@ class SocketEventHandler:
 
         return {"status": "ok"}
 
+    async def viseme_protocol(self, sid, data):
+        session = await self.session_manager.get(sid)
+        if not session:
+            return
+
+        version = 0
+        if isinstance(data, dict):
+            try:
+                version = int(data.get("version", 1))
+            except (TypeError, ValueError):
+                pass
+        if version < 1:
+            return {"status": "Invalid"}
+
+        # 클라이언트가 지원하는 버전과 서버 버전 중 낮은 쪽 사용
+        version = min(version, VISEME_PROTOCOL_VERSION)
+        session.viseme_version = version
+
+        if session.peer_connection:
+            session.peer_connection.tts_track.viseme_version = version
+
+        return {"status": "ok", "version": version}
+
     async def message(self, sid, data):
         session = await self.session_manager.get(sid)
         if not session:
@@ -114,7 +137,7 @@ class SocketEventHandler:
 
         for supported in supported_models:
             if supported.equal(model):
-                session.chat.change_model(supported)
+                await session.chat.change_model(supported)
                 return {"status": "ok"}
 
         return {